@@ -279,7 +279,8 @@ def query_stats():
     click.echo(f"  Total edges: {graph.edge_count}")
     
     for node_type in NodeType:
-        count = len(list(graph.nodes(node_type)))
+        # Count without materializing a throwaway list of nodes
+        count = sum(1 for _ in graph.nodes(node_type))
         if count > 0:
             click.echo(f"  {node_type.name}: {count}")
 
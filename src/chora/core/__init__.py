@@ -118,6 +118,7 @@ from chora.core.meaning import Meaning
 # Validation
 from chora.core.validation import (
     validate_graph,
+    validate_graph_parallel,
     validate_node,
     validate_edge,
     GraphValidator,
@@ -183,6 +184,7 @@ __all__ = [
     "Meaning",
     # Validation
     "validate_graph",
+    "validate_graph_parallel",
     "validate_node",
     "validate_edge",
     "GraphValidator",
@@ -18,7 +18,7 @@ from chora.core.uncertainty import UncertaintyValue
 from chora.core.provenance import ProvenanceChain, Provenance
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatialEdge:
     """
     An edge in the platial graph.
@@ -7,6 +7,7 @@ relation between an agent and a spatial extent.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
@@ -16,7 +17,7 @@ from chora.core.node import PlatialNode
 from chora.core.temporal import TimeInterval
 
 
-@dataclass
+@dataclass(slots=True)
 class Encounter(PlatialNode):
     """
     A spatio-temporal relation between an agent and a spatial extent.
@@ -70,12 +71,29 @@ class Encounter(PlatialNode):
     
     # Set node_type
     node_type: NodeType = field(default=NodeType.ENCOUNTER, init=False)
-    
+
+    # Epoch seconds of start_time, cached at construction so detection
+    # passes read one attribute instead of re-running .timestamp() per
+    # encounter per pass (start_time is never reassigned after creation)
+    start_epoch: int = field(init=False, repr=False)
+
+    # 4-hour time-of-day bucket (0-5), cached for routine grouping
+    hour_bucket: int = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
         if self.end_time is not None and self.end_time < self.start_time:
             raise ValueError("end_time cannot precede start_time")
         if not 0.0 <= self.intensity <= 1.0:
             raise ValueError("intensity must be in [0, 1]")
+        self.start_epoch = int(self.start_time.timestamp())
+        self.hour_bucket = self.start_time.hour // 4
+        # Intern the ids: the same agent/extent strings recur across
+        # thousands of encounters, and detection hashes and compares
+        # them constantly — interning makes both a pointer operation
+        if isinstance(self.agent_id, str):
+            self.agent_id = sys.intern(self.agent_id)
+        if isinstance(self.extent_id, str):
+            self.extent_id = sys.intern(self.extent_id)
     
     def __repr__(self) -> str:
         return (f"Encounter(agent={self.agent_id!r}, "
@@ -7,11 +7,14 @@ that enables multiple, even conflicting experiences to coexist.
 
 from __future__ import annotations
 
+import bisect
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator, Sequence
 
+import numpy as np
+
 from chora.core.types import NodeType, EdgeType, NodeId, EdgeId
 from chora.core.node import PlatialNode
 from chora.core.edge import PlatialEdge
@@ -68,7 +71,35 @@ class PlatialGraph:
     _edges_by_type: dict[EdgeType, set[EdgeId]] = field(
         default_factory=lambda: defaultdict(set), repr=False
     )
-    
+    _familiarity_index: dict[tuple, NodeId] = field(
+        default_factory=dict, repr=False
+    )
+    _nodes_by_extent: dict[str, set[NodeId]] = field(
+        default_factory=lambda: defaultdict(set), repr=False
+    )
+    _enc_by_agent_extent: dict[tuple[str, str], set[NodeId]] = field(
+        default_factory=lambda: defaultdict(set), repr=False
+    )
+
+    # Monotonic counter bumped on every mutation; lets callers detect
+    # whether the graph changed since derived results were computed
+    _version: int = field(default=0, repr=False)
+
+    # Lazily materialized per-type node lists, valid for one version
+    _type_snapshot: tuple | None = field(default=None, repr=False)
+
+    # Nodes sorted by valid_from, valid for one version; see
+    # nodes_in_interval
+    _temporal_snapshot: tuple | None = field(default=None, repr=False)
+
+    # Flattened CSR adjacency, valid for one version; see adjacency_csr
+    _csr_snapshot: tuple | None = field(default=None, repr=False)
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, incremented whenever the graph changes."""
+        return self._version
+
     # =========================================================================
     # Node Operations
     # =========================================================================
@@ -99,6 +130,18 @@ class PlatialGraph:
         
         self._nodes[node.id] = node
         self._nodes_by_type[node.node_type].add(node.id)
+        if node.node_type == NodeType.FAMILIARITY:
+            key = (getattr(node, "agent_id", None), getattr(node, "extent_id", None))
+            self._familiarity_index[key] = node.id
+        extent_id = getattr(node, "extent_id", None)
+        if extent_id is not None:
+            self._nodes_by_extent[str(extent_id)].add(node.id)
+            if node.node_type == NodeType.ENCOUNTER:
+                agent_id = getattr(node, "agent_id", None)
+                if agent_id is not None:
+                    key = (str(agent_id), str(extent_id))
+                    self._enc_by_agent_extent[key].add(node.id)
+        self._version += 1
         return node.id
     
     def get_node(self, node_id: NodeId) -> PlatialNode:
@@ -139,10 +182,23 @@ class PlatialGraph:
         
         # Remove from indices
         self._nodes_by_type[node.node_type].discard(node_id)
+        if node.node_type == NodeType.FAMILIARITY:
+            key = (getattr(node, "agent_id", None), getattr(node, "extent_id", None))
+            if self._familiarity_index.get(key) == node_id:
+                del self._familiarity_index[key]
+        extent_id = getattr(node, "extent_id", None)
+        if extent_id is not None:
+            self._nodes_by_extent[str(extent_id)].discard(node_id)
+            if node.node_type == NodeType.ENCOUNTER:
+                agent_id = getattr(node, "agent_id", None)
+                if agent_id is not None:
+                    key = (str(agent_id), str(extent_id))
+                    self._enc_by_agent_extent[key].discard(node_id)
         del self._nodes[node_id]
         del self._outgoing_edges[node_id]
         del self._incoming_edges[node_id]
-        
+        self._version += 1
+
         return node
     
     def nodes(self, node_type: NodeType | None = None) -> Iterator[PlatialNode]:
@@ -160,6 +216,149 @@ class PlatialGraph:
             for node_id in self._nodes_by_type[node_type]:
                 yield self._nodes[node_id]
     
+    def find_familiarity(self, agent_id, extent_id) -> PlatialNode | None:
+        """
+        Look up the familiarity node for an agent-extent pair.
+
+        Uses an index maintained on add/remove, so this is O(1)
+        rather than a scan over all FAMILIARITY nodes.
+        """
+        node_id = self._familiarity_index.get((agent_id, extent_id))
+        if node_id is None:
+            return None
+        return self._nodes.get(node_id)
+
+    def nodes_for_extent(self, extent_id,
+                         node_type: NodeType | None = None) -> Iterator[PlatialNode]:
+        """
+        Iterate over nodes that reference a spatial extent.
+
+        Covers nodes carrying an `extent_id` attribute (encounters,
+        familiarities, meanings), served from an index maintained on
+        add/remove rather than a full-graph scan.
+        """
+        for node_id in self._nodes_by_extent.get(str(extent_id), ()):
+            node = self._nodes[node_id]
+            if node_type is None or node.node_type == node_type:
+                yield node
+
+    def snapshot_by_type(self, *node_types: NodeType) -> dict[NodeType, list[PlatialNode]]:
+        """
+        Materialized node lists for the requested types.
+
+        The snapshot is cached until the next graph mutation, so
+        derivations that traverse the same type sets repeatedly (e.g.
+        place extraction across many extents) share one scan.
+        """
+        if self._type_snapshot is not None and self._type_snapshot[0] == self._version:
+            snapshot = self._type_snapshot[1]
+        else:
+            snapshot = {}
+            self._type_snapshot = (self._version, snapshot)
+
+        for node_type in node_types:
+            if node_type not in snapshot:
+                snapshot[node_type] = [
+                    self._nodes[node_id]
+                    for node_id in self._nodes_by_type[node_type]
+                ]
+        return snapshot
+
+    def encounters_for_agent_extent(self, agent_id,
+                                    extent_id) -> Iterator[PlatialNode]:
+        """
+        Iterate over an agent's encounters at a spatial extent.
+
+        Served from the (agent, extent) partition maintained on
+        add/remove, so agent-filtered place extraction avoids re-testing
+        every candidate encounter's agent_id.
+        """
+        for node_id in self._enc_by_agent_extent.get(
+            (str(agent_id), str(extent_id)), ()
+        ):
+            yield self._nodes[node_id]
+
+    def encounters(self, agent_id=None, extent_id=None,
+                   start_time: datetime | None = None,
+                   end_time: datetime | None = None) -> Iterator[PlatialNode]:
+        """
+        Iterate encounters, narrowed by whichever index applies.
+
+        With both agent and extent given the (agent, extent) partition
+        is used; with only an extent, the extent index; otherwise the
+        typed index. Time bounds are applied per candidate after the
+        index cut.
+        """
+        if agent_id is not None and extent_id is not None:
+            candidate_ids = self._enc_by_agent_extent.get(
+                (str(agent_id), str(extent_id)), ()
+            )
+        elif extent_id is not None:
+            candidate_ids = [
+                node_id
+                for node_id in self._nodes_by_extent.get(str(extent_id), ())
+                if self._nodes[node_id].node_type == NodeType.ENCOUNTER
+            ]
+        else:
+            candidate_ids = self._nodes_by_type[NodeType.ENCOUNTER]
+
+        for node_id in candidate_ids:
+            node = self._nodes[node_id]
+            if agent_id is not None and extent_id is None:
+                if getattr(node, "agent_id", None) != agent_id:
+                    continue
+            if start_time is not None and node.start_time < start_time:
+                continue
+            if end_time is not None:
+                node_end = getattr(node, "end_time", None)
+                if node_end is not None and node_end > end_time:
+                    continue
+            yield node
+
+    def encounter_count_for_extent(self, extent_id) -> int:
+        """
+        Count encounters linked to an extent via OCCURS_AT edges.
+
+        A cheap upper bound useful for filtering extents before any
+        expensive per-place gathering.
+        """
+        # .get avoids materializing an empty set for unknown ids
+        # (self._incoming_edges is a defaultdict)
+        count = 0
+        for edge_id in self._incoming_edges.get(NodeId(str(extent_id)), ()):
+            if self._edges[edge_id].edge_type == EdgeType.OCCURS_AT:
+                count += 1
+        return count
+
+    def nodes_in_interval(self, start: datetime,
+                          end: datetime) -> Iterator[PlatialNode]:
+        """
+        Iterate over nodes whose validity overlaps [start, end].
+
+        Backed by a per-version list sorted on ``valid_from``: a bisect
+        on the query's end bound discards every node that begins after
+        the range, leaving only the start-side candidates to test
+        against their (mutable) ``valid_to``. ``valid_from`` is fixed at
+        creation, so the sorted order survives ``invalidate()`` calls
+        and only mutations rebuild it.
+        """
+        if (self._temporal_snapshot is not None
+                and self._temporal_snapshot[0] == self._version):
+            _, starts, ordered = self._temporal_snapshot
+        else:
+            ordered = sorted(
+                self._nodes.values(),
+                key=lambda n: n.temporal.valid_from or datetime.min,
+            )
+            starts = [n.temporal.valid_from or datetime.min for n in ordered]
+            self._temporal_snapshot = (self._version, starts, ordered)
+
+        for i in range(bisect.bisect_right(starts, end)):
+            node = ordered[i]
+            valid_to = node.temporal.valid_to
+            if valid_to is None or valid_to >= start:
+                yield node
+
     def nodes_valid_at(self, timestamp: datetime,
                        node_type: NodeType | None = None) -> Iterator[PlatialNode]:
         """Iterate over nodes valid at a given timestamp."""
@@ -195,7 +394,8 @@ class PlatialGraph:
         self._outgoing_edges[edge.source_id].add(edge.id)
         self._incoming_edges[edge.target_id].add(edge.id)
         self._edges_by_type[edge.edge_type].add(edge.id)
-        
+        self._version += 1
+
         return edge.id
     
     def get_edge(self, edge_id: EdgeId) -> PlatialEdge:
@@ -209,6 +409,12 @@ class PlatialGraph:
     def has_edge(self, edge_id: EdgeId) -> bool:
         """Check if an edge exists."""
         return edge_id in self._edges
+
+    def has_outgoing_edge(self, node_id: NodeId, edge_id: EdgeId) -> bool:
+        """Check if the edge originates from the given node, in O(1)."""
+        # .get rather than indexing: the index is a defaultdict and a
+        # plain lookup would insert an empty set for unknown nodes
+        return edge_id in self._outgoing_edges.get(node_id, ())
     
     def remove_edge(self, edge_id: EdgeId) -> PlatialEdge:
         """Remove an edge from the graph."""
@@ -218,7 +424,8 @@ class PlatialGraph:
         self._incoming_edges[edge.target_id].discard(edge_id)
         self._edges_by_type[edge.edge_type].discard(edge_id)
         del self._edges[edge_id]
-        
+        self._version += 1
+
         return edge
     
     def edges(self, edge_type: EdgeType | None = None) -> Iterator[PlatialEdge]:
@@ -229,21 +436,54 @@ class PlatialGraph:
             for edge_id in self._edges_by_type[edge_type]:
                 yield self._edges[edge_id]
     
-    def outgoing_edges(self, node_id: NodeId,
-                       edge_type: EdgeType | None = None) -> Iterator[PlatialEdge]:
-        """Get edges originating from a node."""
-        for edge_id in self._outgoing_edges[node_id]:
-            edge = self._edges[edge_id]
-            if edge_type is None or edge.edge_type == edge_type:
-                yield edge
-    
-    def incoming_edges(self, node_id: NodeId,
-                       edge_type: EdgeType | None = None) -> Iterator[PlatialEdge]:
-        """Get edges pointing to a node."""
-        for edge_id in self._incoming_edges[node_id]:
-            edge = self._edges[edge_id]
-            if edge_type is None or edge.edge_type == edge_type:
-                yield edge
+    def outgoing_edges(
+        self, node_id: NodeId,
+        edge_type: EdgeType | frozenset[EdgeType] | None = None
+    ) -> Iterator[PlatialEdge]:
+        """
+        Get edges originating from a node.
+
+        `edge_type` may be a single type or a set of types; passing the
+        set here keeps the filter inside the iteration instead of a
+        per-edge check at every call site.
+        """
+        if edge_type is None:
+            for edge_id in self._outgoing_edges[node_id]:
+                yield self._edges[edge_id]
+        elif isinstance(edge_type, EdgeType):
+            for edge_id in self._outgoing_edges[node_id]:
+                edge = self._edges[edge_id]
+                if edge.edge_type == edge_type:
+                    yield edge
+        else:
+            for edge_id in self._outgoing_edges[node_id]:
+                edge = self._edges[edge_id]
+                if edge.edge_type in edge_type:
+                    yield edge
+
+    def incoming_edges(
+        self, node_id: NodeId,
+        edge_type: EdgeType | frozenset[EdgeType] | None = None
+    ) -> Iterator[PlatialEdge]:
+        """
+        Get edges pointing to a node.
+
+        Accepts a single type or a set of types, like
+        :meth:`outgoing_edges`.
+        """
+        if edge_type is None:
+            for edge_id in self._incoming_edges[node_id]:
+                yield self._edges[edge_id]
+        elif isinstance(edge_type, EdgeType):
+            for edge_id in self._incoming_edges[node_id]:
+                edge = self._edges[edge_id]
+                if edge.edge_type == edge_type:
+                    yield edge
+        else:
+            for edge_id in self._incoming_edges[node_id]:
+                edge = self._edges[edge_id]
+                if edge.edge_type in edge_type:
+                    yield edge
     
     def neighbors(self, node_id: NodeId,
                   edge_type: EdgeType | None = None) -> Iterator[PlatialNode]:
@@ -256,7 +496,58 @@ class PlatialGraph:
         """Get predecessor nodes (via incoming edges)."""
         for edge in self.incoming_edges(node_id, edge_type):
             yield self._nodes[edge.source_id]
-    
+
+    def adjacency_csr(self) -> tuple:
+        """
+        Return flattened CSR adjacency for unfiltered traversals.
+
+        Rebuilt lazily per graph version; repeated traversals on an
+        unchanged graph reuse the same arrays. BFS over two contiguous
+        int32 arrays touches far fewer bytes per edge than chasing
+        dict/set objects, and visited checks become array indexing.
+
+        Returns
+        -------
+        tuple
+            ``(row_of, node_ids, out_indptr, out_indices, in_indptr,
+            in_indices)`` where ``row_of`` maps node id to row,
+            ``node_ids`` is the inverse mapping, and the indptr/indices
+            pairs are standard CSR over rows for outgoing and incoming
+            edges respectively.
+        """
+        snap = self._csr_snapshot
+        if snap is not None and snap[0] == self._version:
+            return snap[1]
+
+        node_ids = list(self._nodes)
+        row_of = {nid: row for row, nid in enumerate(node_ids)}
+        n = len(node_ids)
+
+        out_counts = np.zeros(n + 1, dtype=np.int32)
+        in_counts = np.zeros(n + 1, dtype=np.int32)
+        for edge in self._edges.values():
+            out_counts[row_of[edge.source_id] + 1] += 1
+            in_counts[row_of[edge.target_id] + 1] += 1
+
+        out_indptr = np.cumsum(out_counts, dtype=np.int32)
+        in_indptr = np.cumsum(in_counts, dtype=np.int32)
+        out_indices = np.empty(int(out_indptr[-1]), dtype=np.int32)
+        in_indices = np.empty(int(in_indptr[-1]), dtype=np.int32)
+
+        out_fill = out_indptr[:-1].copy()
+        in_fill = in_indptr[:-1].copy()
+        for edge in self._edges.values():
+            src = row_of[edge.source_id]
+            dst = row_of[edge.target_id]
+            out_indices[out_fill[src]] = dst
+            out_fill[src] += 1
+            in_indices[in_fill[dst]] = src
+            in_fill[dst] += 1
+
+        csr = (row_of, node_ids, out_indptr, out_indices, in_indptr, in_indices)
+        self._csr_snapshot = (self._version, csr)
+        return csr
+
     # =========================================================================
     # Graph Properties
     # =========================================================================
@@ -337,6 +628,31 @@ class PlatialGraph:
         
         return snap
     
+    def clone(self) -> PlatialGraph:
+        """
+        Structural copy of the graph.
+
+        Copies the node/edge stores and all indexes so the clone's
+        topology can be mutated independently; the node and edge
+        objects themselves are shared, making this far cheaper than a
+        deep copy for fixtures and what-if experiments.
+        """
+        other = PlatialGraph(name=self.name, description=self.description)
+        other._nodes = dict(self._nodes)
+        other._edges = dict(self._edges)
+        for source, target in (
+            (self._nodes_by_type, other._nodes_by_type),
+            (self._outgoing_edges, other._outgoing_edges),
+            (self._incoming_edges, other._incoming_edges),
+            (self._edges_by_type, other._edges_by_type),
+            (self._nodes_by_extent, other._nodes_by_extent),
+            (self._enc_by_agent_extent, other._enc_by_agent_extent),
+        ):
+            for key, members in source.items():
+                target[key] = set(members)
+        other._familiarity_index = dict(self._familiarity_index)
+        return other
+
     def clear(self) -> None:
         """Remove all nodes and edges."""
         self._nodes.clear()
@@ -345,3 +661,7 @@ class PlatialGraph:
         self._outgoing_edges.clear()
         self._incoming_edges.clear()
         self._edges_by_type.clear()
+        self._familiarity_index.clear()
+        self._nodes_by_extent.clear()
+        self._enc_by_agent_extent.clear()
+        self._version += 1
@@ -8,11 +8,12 @@ govern familiarity, affect, and practice stability.
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Callable, Protocol, TypeAlias
 
+import numpy as np
+
 from chora.core.exceptions import InvalidTimeIntervalError, TemporalError
 
 
@@ -183,25 +184,26 @@ class TemporalValidity:
 # Decay Functions
 # =============================================================================
 
-def exponential_decay(initial_value: float, time_delta: float, 
-                      half_life: float = 7.0) -> float:
+def exponential_decay(initial_value: float, time_delta: float | np.ndarray,
+                      half_life: float = 7.0) -> float | np.ndarray:
     """
     Exponential decay function for familiarity and affect.
-    
+
     Parameters
     ----------
     initial_value : float
         Starting value (typically in [0, 1]).
-    time_delta : float
-        Time elapsed (in days).
+    time_delta : float | np.ndarray
+        Time elapsed (in days). An array decays all elements in one
+        vectorized call.
     half_life : float
         Time for value to decay to half (in days). Default 7 days.
-    
+
     Returns
     -------
-    float
-        Decayed value.
-    
+    float | np.ndarray
+        Decayed value(s), matching the shape of ``time_delta``.
+
     Examples
     --------
     >>> exponential_decay(1.0, 7.0, half_life=7.0)  # After one half-life
@@ -209,34 +211,46 @@ def exponential_decay(initial_value: float, time_delta: float,
     >>> exponential_decay(1.0, 14.0, half_life=7.0)  # After two half-lives
     0.25
     """
-    if time_delta < 0:
-        raise TemporalError("Negative time delta", time_delta=time_delta)
     if half_life <= 0:
         raise TemporalError("Half-life must be positive", half_life=half_life)
-    
-    decay_constant = math.log(2) / half_life
-    return initial_value * math.exp(-decay_constant * time_delta)
+    if isinstance(time_delta, np.ndarray):
+        if (time_delta < 0).any():
+            raise TemporalError("Negative time delta",
+                                time_delta=float(time_delta.min()))
+        return initial_value * np.exp2(-time_delta / half_life)
+    if time_delta < 0:
+        raise TemporalError("Negative time delta", time_delta=time_delta)
+
+    # 2**(-t/h) == exp(-ln2 * t/h); working in base 2 drops the
+    # per-call decay constant (math.exp2 would too, but is 3.11+)
+    return initial_value * 2.0 ** (-time_delta / half_life)
 
 
-def linear_decay(initial_value: float, time_delta: float,
-                 rate: float = 0.1) -> float:
+def linear_decay(initial_value: float, time_delta: float | np.ndarray,
+                 rate: float = 0.1) -> float | np.ndarray:
     """
     Linear decay function.
-    
+
     Parameters
     ----------
     initial_value : float
         Starting value.
-    time_delta : float
-        Time elapsed (in days).
+    time_delta : float | np.ndarray
+        Time elapsed (in days). An array decays all elements in one
+        vectorized call.
     rate : float
         Decay rate per day. Default 0.1.
-    
+
     Returns
     -------
-    float
-        Decayed value, clamped to [0, initial_value].
+    float | np.ndarray
+        Decayed value(s), clamped to [0, initial_value].
     """
+    if isinstance(time_delta, np.ndarray):
+        if (time_delta < 0).any():
+            raise TemporalError("Negative time delta",
+                                time_delta=float(time_delta.min()))
+        return np.maximum(0.0, initial_value - rate * time_delta)
     if time_delta < 0:
         raise TemporalError("Negative time delta", time_delta=time_delta)
     return max(0.0, initial_value - rate * time_delta)
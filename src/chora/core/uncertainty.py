@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Sequence
 
+import numpy as np
+
 from chora.core.exceptions import (
     DistributionError,
     InvalidProbabilityError,
@@ -19,6 +21,11 @@ from chora.core.exceptions import (
 )
 
 
+# Shared generator for callers that do not supply their own; built once
+# so per-sample calls skip Generator construction
+_default_rng = np.random.default_rng()
+
+
 def _validate_probability(value: float, name: str = "Probability") -> None:
     """Validate that a value is a valid probability in [0, 1]."""
     if not 0.0 <= value <= 1.0:
@@ -169,12 +176,17 @@ class GaussianDistribution(ProbabilityDistribution):
         exponent = -0.5 * ((x - self.mu) / self.sigma) ** 2
         return coefficient * math.exp(exponent)
     
-    def sample(self) -> float:
-        """Draw a random sample using Box-Muller transform."""
-        import random
-        u1, u2 = random.random(), random.random()
-        z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-        return self.mu + self.sigma * z
+    def sample(self, rng: np.random.Generator | None = None) -> float:
+        """
+        Draw a random sample.
+
+        Uses NumPy's Generator (Ziggurat normal sampling) rather than a
+        hand-rolled Box-Muller transform; pass ``rng`` for seeded,
+        thread-local draws.
+        """
+        if rng is None:
+            rng = _default_rng
+        return float(rng.normal(self.mu, self.sigma))
     
     @property
     def mean(self) -> float:
@@ -213,6 +225,9 @@ class CategoricalDistribution(ProbabilityDistribution):
     categories: Sequence[str]
     probabilities: Sequence[float]
     _prob_dict: dict[str, float] = field(init=False, repr=False)
+    _cum: np.ndarray = field(init=False, repr=False)
+    _mode_idx: int = field(init=False, repr=False)
+    _entropy: float = field(init=False, repr=False)
     
     def __post_init__(self) -> None:
         if len(self.categories) != len(self.probabilities):
@@ -232,7 +247,14 @@ class CategoricalDistribution(ProbabilityDistribution):
             )
         
         self._prob_dict = dict(zip(self.categories, self.probabilities))
-    
+        # Construct-once caches: mode, entropy, and the cumulative used
+        # by sample() never change after validation
+        probs = np.asarray(self.probabilities, dtype=np.float64)
+        self._cum = np.cumsum(probs)
+        self._mode_idx = int(np.argmax(probs))
+        positive = probs[probs > 0]
+        self._entropy = float(-np.sum(positive * np.log2(positive)))
+
     def probability(self, category: str) -> float:
         """Get probability of a specific category."""
         return self._prob_dict.get(category, 0.0)
@@ -241,13 +263,14 @@ class CategoricalDistribution(ProbabilityDistribution):
         """Not applicable for categorical; raises error."""
         raise NotImplementedError("Use probability() for categorical distributions")
     
-    def sample(self) -> str:
-        """Draw a random category."""
-        import random
-        return random.choices(
-            list(self.categories),
-            weights=list(self.probabilities)
-        )[0]
+    def sample(self, rng: np.random.Generator | None = None) -> str:
+        """Draw a random category; pass ``rng`` for seeded draws."""
+        if rng is None:
+            rng = _default_rng
+        # O(log n) bisection over the precomputed cumulative; min guards
+        # against float round-up pushing the draw past the final bin
+        idx = int(np.searchsorted(self._cum, rng.random(), side="right"))
+        return self.categories[min(idx, len(self.categories) - 1)]
     
     @property
     def mean(self) -> float:
@@ -260,15 +283,12 @@ class CategoricalDistribution(ProbabilityDistribution):
     @property
     def mode(self) -> str:
         """Return the most likely category."""
-        return max(self._prob_dict, key=lambda k: self._prob_dict[k])
-    
+        return self.categories[self._mode_idx]
+
     @property
     def entropy(self) -> float:
-        """Shannon entropy of the distribution."""
-        return -sum(
-            p * math.log2(p) if p > 0 else 0
-            for p in self.probabilities
-        )
+        """Shannon entropy of the distribution (cached at construction)."""
+        return self._entropy
 
 
 # =============================================================================
@@ -6,6 +6,7 @@ Validates graph structure, schema constraints, and epistemic consistency.
 
 from __future__ import annotations
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Callable
 
@@ -17,7 +18,7 @@ from chora.core.exceptions import ValidationError, SchemaValidationError
 
 
 # Edge constraints: (source_type, edge_type, target_type)
-VALID_EDGE_SCHEMA: set[tuple[NodeType, EdgeType, NodeType]] = {
+VALID_EDGE_SCHEMA: frozenset[tuple[NodeType, EdgeType, NodeType]] = frozenset({
     (NodeType.AGENT, EdgeType.PARTICIPATES_IN, NodeType.ENCOUNTER),
     (NodeType.ENCOUNTER, EdgeType.OCCURS_AT, NodeType.SPATIAL_EXTENT),
     (NodeType.ENCOUNTER, EdgeType.HAS_CONTEXT, NodeType.CONTEXT),
@@ -34,28 +35,63 @@ VALID_EDGE_SCHEMA: set[tuple[NodeType, EdgeType, NodeType]] = {
     (NodeType.MEANING, EdgeType.DERIVES_FROM, NodeType.ENCOUNTER),
     (NodeType.MEANING, EdgeType.CONFLICTS_WITH, NodeType.MEANING),
     (NodeType.MEANING, EdgeType.SIMILAR_TO, NodeType.MEANING),
-}
+})
 
+# Integer codes per enum member (values are strings, so codes come from
+# member order) let the schema check hash one int per edge instead of a
+# three-enum tuple
+_NODE_CODE: dict[NodeType, int] = {t: i for i, t in enumerate(NodeType)}
+_EDGE_CODE: dict[EdgeType, int] = {t: i for i, t in enumerate(EdgeType)}
+_VALID_EDGE_SCHEMA_INT: frozenset[int] = frozenset(
+    (_NODE_CODE[s] << 16) | (_EDGE_CODE[e] << 8) | _NODE_CODE[t]
+    for s, e, t in VALID_EDGE_SCHEMA
+)
 
-@dataclass
+
+# Cap on retained diagnostics; beyond this the oldest entries rotate out
+# so a catastrophically broken graph cannot exhaust memory
+_MAX_DIAGNOSTICS = 10_000
+
+
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of a validation check."""
-    
+    """
+    Result of a validation check.
+
+    Diagnostics are stored unformatted as (template, args) pairs in
+    bounded ring buffers; messages are only rendered when `errors` or
+    `warnings` is read.
+    """
+
     valid: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
-    
-    def add_error(self, message: str) -> None:
-        self.errors.append(message)
+    _errors: deque[tuple[str, tuple]] = field(
+        default_factory=lambda: deque(maxlen=_MAX_DIAGNOSTICS), repr=False
+    )
+    _warnings: deque[tuple[str, tuple]] = field(
+        default_factory=lambda: deque(maxlen=_MAX_DIAGNOSTICS), repr=False
+    )
+
+    @property
+    def errors(self) -> list[str]:
+        """Formatted error messages."""
+        return [t % a if a else t for t, a in self._errors]
+
+    @property
+    def warnings(self) -> list[str]:
+        """Formatted warning messages."""
+        return [t % a if a else t for t, a in self._warnings]
+
+    def add_error(self, message: str, *args: object) -> None:
+        self._errors.append((message, args))
         self.valid = False
-    
-    def add_warning(self, message: str) -> None:
-        self.warnings.append(message)
-    
+
+    def add_warning(self, message: str, *args: object) -> None:
+        self._warnings.append((message, args))
+
     def merge(self, other: ValidationResult) -> None:
         """Merge another result into this one."""
-        self.errors.extend(other.errors)
-        self.warnings.extend(other.warnings)
+        self._errors.extend(other._errors)
+        self._warnings.extend(other._warnings)
         if not other.valid:
             self.valid = False
 
@@ -63,123 +99,262 @@ class ValidationResult:
 def validate_node(node: PlatialNode) -> ValidationResult:
     """
     Validate a single node.
-    
+
     Checks:
     - Node has valid ID
     - Node type is set
     - Temporal validity is consistent
     """
     result = ValidationResult(valid=True)
-    
-    if not node.id:
-        result.add_error(f"Node has empty ID")
-    
-    if node.node_type is None:
-        result.add_error(f"Node {node.id} has no type")
-    
-    # Check temporal consistency
-    if (node.temporal.valid_from is not None and 
-        node.temporal.valid_to is not None and
-        node.temporal.valid_to < node.temporal.valid_from):
-        result.add_error(
-            f"Node {node.id}: valid_to precedes valid_from"
-        )
-    
+    _validate_node_into(result, node)
     return result
 
 
 def validate_edge(edge: PlatialEdge, graph: PlatialGraph) -> ValidationResult:
     """
     Validate a single edge.
-    
+
     Checks:
     - Source and target nodes exist
     - Edge type is valid for source/target node types
     - Weight is in valid range
     """
     result = ValidationResult(valid=True)
-    
-    if not graph.has_node(edge.source_id):
-        result.add_error(f"Edge {edge.id}: source node {edge.source_id} not found")
-    
-    if not graph.has_node(edge.target_id):
-        result.add_error(f"Edge {edge.id}: target node {edge.target_id} not found")
-    
-    # Check edge schema
-    if graph.has_node(edge.source_id) and graph.has_node(edge.target_id):
-        source = graph.get_node(edge.source_id)
-        target = graph.get_node(edge.target_id)
-        constraint = (source.node_type, edge.edge_type, target.node_type)
-        
-        if constraint not in VALID_EDGE_SCHEMA:
-            result.add_warning(
-                f"Edge {edge.id}: unusual schema {source.node_type} "
-                f"--[{edge.edge_type}]--> {target.node_type}"
-            )
-    
+    _validate_edge_into(result, edge, graph)
     return result
 
 
+def _validate_node_into(result: ValidationResult, node: PlatialNode) -> None:
+    """Append node diagnostics directly to a shared result."""
+    if not node.id:
+        result.add_error("Node has empty ID")
+
+    if node.node_type is None:
+        result.add_error("Node %s has no type", node.id)
+
+    # Check temporal consistency
+    if (node.temporal.valid_from is not None and
+        node.temporal.valid_to is not None and
+        node.temporal.valid_to < node.temporal.valid_from):
+        result.add_error("Node %s: valid_to precedes valid_from", node.id)
+
+
+def _validate_edge_into(
+    result: ValidationResult,
+    edge: PlatialEdge,
+    graph: PlatialGraph,
+    strict: bool = False,
+) -> None:
+    """Append edge diagnostics directly to a shared result."""
+    # Resolve each endpoint with a single lookup instead of separate
+    # has_node/get_node calls
+    source = graph._nodes.get(edge.source_id)
+    target = graph._nodes.get(edge.target_id)
+
+    if source is None:
+        result.add_error("Edge %s: source node %s not found", edge.id, edge.source_id)
+
+    if target is None:
+        result.add_error("Edge %s: target node %s not found", edge.id, edge.target_id)
+
+    # Check edge schema
+    if source is not None and target is not None:
+        key = (
+            (_NODE_CODE[source.node_type] << 16)
+            | (_EDGE_CODE[edge.edge_type] << 8)
+            | _NODE_CODE[target.node_type]
+        )
+
+        if key not in _VALID_EDGE_SCHEMA_INT:
+            template = "Edge %s: unusual schema %s --[%s]--> %s"
+            args = (edge.id, source.node_type, edge.edge_type, target.node_type)
+            if strict:
+                result.add_error(template, *args)
+            else:
+                result.add_warning(template, *args)
+
+
 def validate_graph(graph: PlatialGraph, strict: bool = False) -> ValidationResult:
     """
     Validate entire graph structure.
-    
+
     Parameters
     ----------
     graph : PlatialGraph
         The graph to validate.
     strict : bool
         If True, warnings become errors.
-    
+
     Returns
     -------
     ValidationResult
         Validation result with errors and warnings.
     """
     result = ValidationResult(valid=True)
-    
-    # Validate all nodes
+
+    # Append diagnostics straight into one result rather than allocating
+    # and merging a ValidationResult per node and edge
     for node in graph.nodes():
-        node_result = validate_node(node)
-        result.merge(node_result)
-    
-    # Validate all edges
+        _validate_node_into(result, node)
+
     for edge in graph.edges():
-        edge_result = validate_edge(edge, graph)
-        if strict:
-            for warning in edge_result.warnings:
-                edge_result.add_error(warning)
-            edge_result.warnings.clear()
-        result.merge(edge_result)
-    
+        _validate_edge_into(result, edge, graph, strict=strict)
+
+    return result
+
+
+def validate_graph_parallel(
+    graph: PlatialGraph,
+    strict: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 4096,
+) -> ValidationResult:
+    """
+    Validate a graph with node/edge chunks spread across a thread pool.
+
+    Validation only reads the graph, so chunks can be checked
+    concurrently; each worker accumulates into its own result and the
+    chunks are merged at the end. Falls back to the serial path for
+    graphs smaller than a single chunk.
+
+    Parameters
+    ----------
+    graph : PlatialGraph
+        The graph to validate.
+    strict : bool
+        If True, warnings become errors.
+    workers : int | None
+        Thread count (defaults to the executor's heuristic).
+    chunk_size : int
+        Number of nodes/edges per task.
+
+    Returns
+    -------
+    ValidationResult
+        Merged validation result.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    nodes = list(graph.nodes())
+    edges = list(graph.edges())
+
+    if len(nodes) + len(edges) <= chunk_size:
+        return validate_graph(graph, strict=strict)
+
+    def _check_nodes(chunk: list[PlatialNode]) -> ValidationResult:
+        result = ValidationResult(valid=True)
+        for node in chunk:
+            _validate_node_into(result, node)
+        return result
+
+    def _check_edges(chunk: list[PlatialEdge]) -> ValidationResult:
+        result = ValidationResult(valid=True)
+        for edge in chunk:
+            _validate_edge_into(result, edge, graph, strict=strict)
+        return result
+
+    result = ValidationResult(valid=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        tasks = []
+        for lo in range(0, len(nodes), chunk_size):
+            tasks.append(executor.submit(_check_nodes, nodes[lo:lo + chunk_size]))
+        for lo in range(0, len(edges), chunk_size):
+            tasks.append(executor.submit(_check_edges, edges[lo:lo + chunk_size]))
+        for task in tasks:
+            result.merge(task.result())
+
     return result
 
 
 class GraphValidator:
     """
     Extensible graph validator with custom rules.
-    
+
+    Per-node and per-edge rules are fused into the validator's single
+    node and edge sweeps, so adding rules does not add traversals.
+    Whole-graph rules registered via `add_rule` each walk the graph
+    themselves and should be reserved for checks that need a global view.
+
     Examples
     --------
     >>> validator = GraphValidator()
-    >>> validator.add_rule(my_custom_check)
+    >>> validator.add_node_rule(lambda n: "unnamed" if not n.name else None)
     >>> result = validator.validate(graph)
     """
-    
+
+    # How many (graph, version) results to retain
+    _CACHE_SIZE = 8
+
     def __init__(self) -> None:
         self.rules: list[Callable[[PlatialGraph], ValidationResult]] = []
-        # Add default rules
-        self.rules.append(lambda g: validate_graph(g))
-    
-    def add_rule(self, 
+        self.node_rules: list[Callable[[PlatialNode], str | None]] = []
+        self.edge_rules: list[Callable[[PlatialEdge, PlatialGraph], str | None]] = []
+        self._cache: OrderedDict[tuple[int, int], ValidationResult] = OrderedDict()
+
+    def add_rule(self,
                  rule: Callable[[PlatialGraph], ValidationResult]) -> None:
-        """Add a custom validation rule."""
+        """Add a custom whole-graph validation rule (runs its own traversal)."""
         self.rules.append(rule)
-    
+        self._cache.clear()
+
+    def add_node_rule(self, rule: Callable[[PlatialNode], str | None]) -> None:
+        """
+        Add a per-node rule.
+
+        The rule receives each node and returns an error message, or
+        None if the node is valid.
+        """
+        self.node_rules.append(rule)
+        self._cache.clear()
+
+    def add_edge_rule(
+        self, rule: Callable[[PlatialEdge, PlatialGraph], str | None]
+    ) -> None:
+        """
+        Add a per-edge rule.
+
+        The rule receives each edge and the graph and returns an error
+        message, or None if the edge is valid.
+        """
+        self.edge_rules.append(rule)
+        self._cache.clear()
+
     def validate(self, graph: PlatialGraph) -> ValidationResult:
-        """Run all validation rules."""
+        """
+        Run all validation rules.
+
+        Built-in checks and per-node/per-edge rules share one traversal.
+        Results are memoized against the graph's mutation counter, so
+        repeated validation of an unchanged graph skips the full sweep.
+        """
+        key = (id(graph), graph.version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         result = ValidationResult(valid=True)
+
+        for node in graph.nodes():
+            _validate_node_into(result, node)
+            for rule in self.node_rules:
+                message = rule(node)
+                if message is not None:
+                    result.add_error(message)
+
+        for edge in graph.edges():
+            _validate_edge_into(result, edge, graph)
+            for rule in self.edge_rules:
+                message = rule(edge, graph)
+                if message is not None:
+                    result.add_error(message)
+
         for rule in self.rules:
             rule_result = rule(graph)
             result.merge(rule_result)
+
+        self._cache[key] = result
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
         return result
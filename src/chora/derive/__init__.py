@@ -24,6 +24,7 @@ from chora.derive.familiarity import (
     decay_all_familiarities,
 )
 from chora.derive.practices import (
+    circular_regularity,
     detect_practices,
     detect_routines,
     find_sequence_patterns,
@@ -35,6 +36,7 @@ from chora.derive.liminality import (
 from chora.derive.affect import (
     attach_affect,
     derive_affect_from_context,
+    derive_affects_from_contexts,
 )
 from chora.derive.meaning import (
     attach_meaning,
@@ -55,6 +57,7 @@ __all__ = [
     "compute_familiarity_trajectory",
     "decay_all_familiarities",
     # Practices
+    "circular_regularity",
     "detect_practices",
     "detect_routines",
     "find_sequence_patterns",
@@ -64,6 +67,7 @@ __all__ = [
     # Affect
     "attach_affect",
     "derive_affect_from_context",
+    "derive_affects_from_contexts",
     # Meaning
     "attach_meaning",
     "derive_meaning_from_practices",
@@ -0,0 +1,60 @@
+"""
+Derivation Result Cache
+
+Shared helpers for skipping re-derivation when the same encounter batch
+is processed again (common when notebooks re-run cells). Inputs are
+fingerprinted with a fast blake2b digest; results are held in a small
+bounded cache keyed on that digest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Sequence
+
+from chora.core.encounter import Encounter
+
+# How many derivation results to retain per cache
+_CACHE_SIZE = 32
+
+
+def digest_encounters(encounters: Sequence[Encounter], *parts: Any) -> bytes:
+    """
+    Fingerprint an encounter batch plus any extra parameters.
+
+    Uses blake2b (fast, non-cryptographic use) over the fields that
+    derivations actually read, so identical re-runs hash identically.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for e in encounters:
+        h.update(str(e.id).encode())
+        h.update(str(e.start_time).encode())
+        h.update(str(e.end_time).encode())
+        h.update(str(e.extent_id).encode())
+        h.update(str(e.agent_id).encode())
+    for part in parts:
+        h.update(str(part).encode())
+    return h.digest()
+
+
+class DerivationCache:
+    """Bounded LRU cache for derivation outputs keyed on input digests."""
+
+    def __init__(self, maxsize: int = _CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+
+    def get(self, key: bytes) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: bytes, value: Any) -> None:
+        self._entries[key] = value
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -6,7 +6,9 @@ Attach and derive experiential affect from encounters.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 from chora.core.types import EpistemicLevel, ContextType
 from chora.core.encounter import Encounter
@@ -89,12 +91,101 @@ def derive_affect_from_context(
     """
     if not contexts:
         return None
+
+    uncertainty = 0.2
+    valence, arousal = _context_deltas(contexts)
+
+    # Clamp values
+    valence = max(-1.0, min(1.0, valence))
+    arousal = max(0.0, min(1.0, arousal))
+
+    affect = Affect(
+        affect_state=AffectState(
+            valence=UncertaintyValue(valence, uncertainty),
+            arousal=UncertaintyValue(arousal, uncertainty)
+        ),
+        source_type="context_derived",
+        epistemic_level=EpistemicLevel.DERIVED,
+    )
     
-    # Start with neutral baseline
+    affect.add_provenance(
+        Provenance.derivation(
+            source_ids=[str(encounter.id)] + [str(c.id) for c in contexts],
+            operator="derive_affect_from_context",
+            parameters={"context_count": len(contexts)}
+        )
+    )
+
+    return affect
+
+
+def derive_affects_from_contexts(
+    pairs: Sequence[tuple[Encounter, list[Context]]]
+) -> list[Affect | None]:
+    """
+    Batched variant of :func:`derive_affect_from_context`.
+
+    Accumulates valence/arousal deltas for all encounters into NumPy
+    arrays and clamps them with a single `np.clip`, avoiding per-item
+    scalar clamping overhead across large batches.
+
+    Parameters
+    ----------
+    pairs : Sequence[tuple[Encounter, list[Context]]]
+        (encounter, contexts) pairs to derive affect for.
+
+    Returns
+    -------
+    list[Affect | None]
+        One affect per pair, None where contexts were empty.
+    """
+    if not pairs:
+        return []
+
+    uncertainty = 0.2
+    n = len(pairs)
+    valence = np.zeros(n, dtype=np.float64)
+    arousal = np.full(n, 0.5, dtype=np.float64)
+
+    for i, (_, contexts) in enumerate(pairs):
+        if contexts:
+            valence[i], arousal[i] = _context_deltas(contexts)
+
+    np.clip(valence, -1.0, 1.0, out=valence)
+    np.clip(arousal, 0.0, 1.0, out=arousal)
+
+    affects: list[Affect | None] = []
+
+    for i, (encounter, contexts) in enumerate(pairs):
+        if not contexts:
+            affects.append(None)
+            continue
+
+        affect = Affect(
+            affect_state=AffectState(
+                valence=UncertaintyValue(float(valence[i]), uncertainty),
+                arousal=UncertaintyValue(float(arousal[i]), uncertainty)
+            ),
+            source_type="context_derived",
+            epistemic_level=EpistemicLevel.DERIVED,
+        )
+        affect.add_provenance(
+            Provenance.derivation(
+                source_ids=[str(encounter.id)] + [str(c.id) for c in contexts],
+                operator="derive_affect_from_context",
+                parameters={"context_count": len(contexts)}
+            )
+        )
+        affects.append(affect)
+
+    return affects
+
+
+def _context_deltas(contexts: list[Context]) -> tuple[float, float]:
+    """Accumulate valence/arousal deltas from a neutral baseline."""
     valence = 0.0
     arousal = 0.5
-    uncertainty = 0.2
-    
+
     for ctx in contexts:
         # Purposive context affects valence
         if ctx.context_type == ContextType.PURPOSIVE:
@@ -107,7 +198,7 @@ def derive_affect_from_context(
             elif "explore" in purpose:
                 valence += 0.2
                 arousal += 0.2
-        
+
         # Social context
         elif ctx.context_type == ContextType.SOCIAL:
             value = ctx.value if isinstance(ctx.value, dict) else {}
@@ -115,7 +206,7 @@ def derive_affect_from_context(
                 arousal -= 0.1
             elif value.get("companions"):
                 valence += 0.1 * min(len(value["companions"]), 3)
-        
+
         # Environmental context
         elif ctx.context_type == ContextType.ENVIRONMENTAL:
             conditions = ctx.value if isinstance(ctx.value, dict) else {}
@@ -126,7 +217,7 @@ def derive_affect_from_context(
             if conditions.get("crowded"):
                 arousal += 0.2
                 valence -= 0.1
-        
+
         # Temporal context
         elif ctx.context_type == ContextType.TEMPORAL:
             time_val = str(ctx.value).lower() if ctx.value else ""
@@ -135,26 +226,5 @@ def derive_affect_from_context(
             elif "evening" in time_val:
                 arousal -= 0.1
                 valence += 0.05
-    
-    # Clamp values
-    valence = max(-1.0, min(1.0, valence))
-    arousal = max(0.0, min(1.0, arousal))
-    
-    affect = Affect(
-        affect_state=AffectState(
-            valence=UncertaintyValue(valence, uncertainty),
-            arousal=UncertaintyValue(arousal, uncertainty)
-        ),
-        source_type="context_derived",
-        epistemic_level=EpistemicLevel.DERIVED,
-    )
-    
-    affect.add_provenance(
-        Provenance.derivation(
-            source_ids=[str(encounter.id)] + [str(c.id) for c in contexts],
-            operator="derive_affect_from_context",
-            parameters={"context_count": len(contexts)}
-        )
-    )
-    
-    return affect
+
+    return valence, arousal
@@ -11,13 +11,15 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Sequence
 
+import numpy as np
+
 from chora.core.types import AgentId, ExtentId, EpistemicLevel
 from chora.core.encounter import Encounter
 from chora.core.spatial_extent import SpatialExtent
 from chora.core.provenance import Provenance, ProvenanceType
 
 
-@dataclass
+@dataclass(slots=True)
 class TracePoint:
     """A single point in a GPS or location trace."""
     
@@ -29,6 +31,57 @@ class TracePoint:
 
 
 @dataclass
+class TraceArray:
+    """
+    Structure-of-arrays view of a trace.
+
+    Holds the per-point fields of a trace as parallel NumPy arrays so
+    hot loops can run vectorized over packed columns instead of pulling
+    attributes off one TracePoint object at a time.
+    """
+
+    lon: np.ndarray
+    lat: np.ndarray
+    ts_us: np.ndarray
+    accuracy_m: np.ndarray
+
+    @classmethod
+    def from_points(cls, points: Sequence[TracePoint]) -> TraceArray:
+        """Build column arrays from a sequence of trace points."""
+        n = len(points)
+        return cls(
+            lon=np.fromiter((p.longitude for p in points), dtype=np.float64, count=n),
+            lat=np.fromiter((p.latitude for p in points), dtype=np.float64, count=n),
+            ts_us=np.fromiter(
+                (p.timestamp.timestamp() * 1e6 for p in points),
+                dtype=np.int64,
+                count=n,
+            ),
+            accuracy_m=np.fromiter(
+                (p.accuracy_m for p in points), dtype=np.float64, count=n
+            ),
+        )
+
+    def to_points(self) -> list[TracePoint]:
+        """Reconstruct TracePoint objects from the columns."""
+        return [
+            TracePoint(
+                timestamp=datetime.fromtimestamp(ts / 1e6),
+                longitude=lon,
+                latitude=lat,
+                accuracy_m=acc,
+            )
+            for ts, lon, lat, acc in zip(
+                self.ts_us.tolist(), self.lon.tolist(),
+                self.lat.tolist(), self.accuracy_m.tolist()
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.lon)
+
+
+@dataclass(slots=True)
 class EncounterExtractionConfig:
     """Configuration for encounter extraction."""
     
@@ -82,20 +135,24 @@ def extract_encounters(
     """
     if config is None:
         config = EncounterExtractionConfig()
-    
+
     encounters = []
-    
+
+    if not trace:
+        return encounters
+
+    import shapely
+
+    ta = TraceArray.from_points(trace)
+
     for extent in extents:
         if extent.geometry is None:
             continue
-        
-        # Find points within this extent
-        points_in_extent: list[TracePoint] = []
-        
-        for point in trace:
-            if extent.contains_point(point.longitude, point.latitude):
-                points_in_extent.append(point)
-        
+
+        # Find points within this extent (vectorized point-in-polygon)
+        mask = shapely.contains_xy(extent.geometry, ta.lon, ta.lat)
+        points_in_extent = [trace[i] for i in np.flatnonzero(mask)]
+
         if len(points_in_extent) < config.min_points:
             continue
         
@@ -153,7 +210,15 @@ def extract_encounters_from_trace(
             continue
         
         # Sort by time
-        cluster_sorted = sorted(cluster, key=lambda p: p.timestamp)
+        order = np.argsort(
+            np.fromiter(
+                (p.timestamp.timestamp() for p in cluster),
+                dtype=np.float64,
+                count=len(cluster),
+            ),
+            kind="stable",
+        )
+        cluster_sorted = [cluster[i] for i in order]
         segments = _segment_by_gap(cluster_sorted, config.max_gap)
         
         for segment in segments:
@@ -188,27 +253,23 @@ def merge_nearby_encounters(
     if not encounters:
         return []
     
-    # Sort by extent and time
-    sorted_encs = sorted(encounters, key=lambda e: (str(e.extent_id), e.start_time))
+    # Sort by extent and time (ids are plain strings, so no str() needed)
+    sorted_encs = sorted(encounters, key=lambda e: (e.extent_id, e.start_time))
     merged = []
     current = sorted_encs[0]
-    
+
     for enc in sorted_encs[1:]:
-        if (enc.extent_id == current.extent_id and 
+        if (enc.extent_id == current.extent_id and
             current.end_time is not None and
             enc.start_time - current.end_time <= max_time_gap):
-            # Extend current encounter
-            current = Encounter(
-                agent_id=current.agent_id,
-                extent_id=current.extent_id,
-                start_time=current.start_time,
-                end_time=enc.end_time,
-                epistemic_level=current.epistemic_level,
-            )
+            # Extend current encounter in place; rebuilding an Encounter
+            # per extension allocates a fresh UUID and metadata dict for
+            # every point of a long dwell
+            current.end_time = enc.end_time
         else:
             merged.append(current)
             current = enc
-    
+
     merged.append(current)
     return merged
 
@@ -220,54 +281,60 @@ def _segment_by_gap(
     """Segment points into continuous sequences based on time gaps."""
     if not points:
         return []
-    
-    segments = []
-    current_segment = [points[0]]
-    
-    for i in range(1, len(points)):
-        gap = points[i].timestamp - points[i-1].timestamp
-        if gap <= max_gap:
-            current_segment.append(points[i])
-        else:
-            segments.append(current_segment)
-            current_segment = [points[i]]
-    
-    segments.append(current_segment)
-    return segments
+
+    # Compare gaps as int64 microseconds so the split points come out of
+    # a single vectorized diff rather than per-point datetime arithmetic.
+    ts = np.fromiter(
+        (p.timestamp.timestamp() * 1e6 for p in points),
+        dtype=np.int64,
+        count=len(points),
+    )
+    max_gap_us = int(max_gap.total_seconds() * 1e6)
+
+    breaks = np.flatnonzero(np.diff(ts) > max_gap_us) + 1
+    bounds = [0, *breaks.tolist(), len(points)]
+
+    return [points[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
 
 
 def _cluster_points(
     points: list[TracePoint],
     radius_m: float
 ) -> list[list[TracePoint]]:
-    """Simple spatial clustering using greedy approach."""
+    """Greedy spatial clustering with vectorized neighbor lookups."""
     if not points:
         return []
-    
+
     # Convert radius to approximate degrees (rough approximation)
     radius_deg = radius_m / 111000.0
-    
+
+    coords = np.asarray(
+        [(p.longitude, p.latitude) for p in points], dtype=np.float64
+    )
+
+    try:
+        from scipy.spatial import cKDTree
+        tree = cKDTree(coords)
+    except ImportError:
+        tree = None
+
     clusters = []
-    used = set()
-    
-    for i, point in enumerate(points):
-        if i in used:
+    used = np.zeros(len(points), dtype=bool)
+
+    for i in range(len(points)):
+        if used[i]:
             continue
-        
-        cluster = [point]
-        used.add(i)
-        
-        for j, other in enumerate(points):
-            if j in used:
-                continue
-            
-            dist = ((point.longitude - other.longitude) ** 2 + 
-                    (point.latitude - other.latitude) ** 2) ** 0.5
-            
-            if dist <= radius_deg:
-                cluster.append(other)
-                used.add(j)
-        
-        clusters.append(cluster)
-    
+
+        if tree is not None:
+            neighbors = tree.query_ball_point(coords[i], radius_deg)
+        else:
+            dists = np.hypot(
+                coords[:, 0] - coords[i, 0], coords[:, 1] - coords[i, 1]
+            )
+            neighbors = np.flatnonzero(dists <= radius_deg)
+
+        members = [j for j in neighbors if not used[j]]
+        used[members] = True
+        clusters.append([points[j] for j in members])
+
     return clusters
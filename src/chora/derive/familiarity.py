@@ -6,14 +6,22 @@ Update and compute familiarity states based on encounter patterns.
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from typing import Sequence
 
-from chora.core.types import AgentId, ExtentId, EpistemicLevel
+import numpy as np
+
+from chora.core.types import AgentId, ExtentId, EpistemicLevel, NodeType
 from chora.core.graph import PlatialGraph
 from chora.core.encounter import Encounter
 from chora.core.familiarity import Familiarity
 from chora.core.provenance import Provenance
+from chora.core.exceptions import TemporalError
+from chora.derive._cache import DerivationCache, digest_encounters
+
+# Re-run trajectory computation only when the encounter batch changes
+_trajectory_cache = DerivationCache()
 
 
 def update_familiarity(
@@ -101,29 +109,59 @@ def compute_familiarity_trajectory(
         e for e in encounters
         if e.agent_id == agent_id and e.extent_id == extent_id
     ]
-    
+
     if not relevant:
         return []
-    
-    # Sort by time
-    relevant = sorted(relevant, key=lambda e: e.start_time)
-    
-    # Build trajectory
-    familiarity = Familiarity(
-        agent_id=agent_id,
-        extent_id=extent_id,
-        decay_half_life_days=decay_half_life_days
+
+    key = digest_encounters(relevant, agent_id, extent_id, decay_half_life_days)
+    cached = _trajectory_cache.get(key)
+    if cached is not None:
+        return list(cached)
+
+    # Sort by time (argsort over a float64 buffer beats a Python key callback)
+    order = np.argsort(
+        np.fromiter(
+            (e.start_time.timestamp() for e in relevant),
+            dtype=np.float64,
+            count=len(relevant),
+        ),
+        kind="stable",
     )
-    
+    relevant = [relevant[i] for i in order]
+
+    # Extract the per-encounter inputs once, then run the
+    # decay-and-reinforce recurrence as a pure numeric fold rather than
+    # driving a Familiarity object through reinforce() per encounter
+    times = [e.end_time or e.start_time for e in relevant]
+    durations = np.fromiter(
+        (e.duration_hours or 1.0 for e in relevant),
+        dtype=np.float64,
+        count=len(relevant),
+    )
+    days = np.fromiter(
+        (t.timestamp() / 86400.0 for t in times),
+        dtype=np.float64,
+        count=len(times),
+    )
+
+    deltas = np.diff(days)
+    if deltas.size and deltas.min() < 0:
+        raise TemporalError("Negative time delta", time_delta=float(deltas.min()))
+
+    decay_factors = np.exp(-(math.log(2) / decay_half_life_days) * deltas)
+    increments = np.minimum(0.1, 0.05 * durations)
+
     trajectory = []
-    
-    for enc in relevant:
-        duration = enc.duration_hours or 1.0
-        time = enc.end_time or enc.start_time
-        familiarity.reinforce(duration, at=time)
-        trajectory.append((time, familiarity.value))
-    
-    return trajectory
+    value = 0.0
+
+    for i, time in enumerate(times):
+        if i:
+            value *= decay_factors[i - 1]
+        value = min(1.0, value + increments[i] * (1.0 - value))
+        trajectory.append((time, value))
+
+    _trajectory_cache.put(key, trajectory)
+    return list(trajectory)
 
 
 def decay_all_familiarities(
@@ -135,8 +173,6 @@ def decay_all_familiarities(
     
     Returns the number of familiarities updated.
     """
-    from chora.core.types import NodeType
-    
     count = 0
     to_time = to_time or datetime.now()
     
@@ -154,10 +190,7 @@ def _find_familiarity(
     extent_id: ExtentId | None
 ) -> Familiarity | None:
     """Find familiarity node for agent-extent pair."""
-    from chora.core.types import NodeType
-    
-    for node in graph.nodes(NodeType.FAMILIARITY):
-        if isinstance(node, Familiarity):
-            if node.agent_id == agent_id and node.extent_id == extent_id:
-                return node
+    node = graph.find_familiarity(agent_id, extent_id)
+    if isinstance(node, Familiarity):
+        return node
     return None
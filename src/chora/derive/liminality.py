@@ -6,17 +6,24 @@ Infer liminal qualities from spatial transitions and boundary crossings.
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Sequence
 
+import numpy as np
+
 from chora.core.types import LiminalityType, EpistemicLevel
 from chora.core.encounter import Encounter
 from chora.core.spatial_extent import SpatialExtent
 from chora.core.liminality import Liminality
 from chora.core.provenance import Provenance
+from chora.derive._cache import DerivationCache, digest_encounters
+
+# Re-run crossings detection only when the encounter batch changes
+_crossings_cache = DerivationCache()
 
 
-@dataclass
+@dataclass(slots=True)
 class LiminalityInferenceConfig:
     """Configuration for liminality inference."""
     
@@ -54,30 +61,32 @@ def infer_liminality(
     if config is None:
         config = LiminalityInferenceConfig()
     
-    crossings = detect_boundary_crossings(encounters, extents)
     liminal_zones = []
-    
-    # Aggregate crossings by extent
-    extent_crossings: dict[str, list[tuple[str, str]]] = {}
-    
-    for extent_id, from_type, to_type in crossings:
-        if extent_id not in extent_crossings:
-            extent_crossings[extent_id] = []
-        extent_crossings[extent_id].append((from_type, to_type))
-    
-    for extent_id, transitions in extent_crossings.items():
-        if len(transitions) < config.min_transitions:
+
+    # Aggregate from/to counts per extent in a single pass over the
+    # crossings instead of materializing per-extent transition lists
+    per_extent: dict[str, tuple[Counter, Counter, int]] = {}
+
+    for extent_id, from_type, to_type in detect_boundary_crossings(encounters, extents):
+        entry = per_extent.get(extent_id)
+        if entry is None:
+            entry = (Counter(), Counter(), 0)
+        from_counts, to_counts, _ = entry
+        from_counts[from_type] += 1
+        to_counts[to_type] += 1
+        per_extent[extent_id] = (from_counts, to_counts, entry[2] + 1)
+
+    for extent_id, (from_counts, to_counts, count) in per_extent.items():
+        if count < config.min_transitions:
             continue
-        
+
         # Calculate intensity based on transition frequency
-        intensity = min(1.0, len(transitions) / (config.min_transitions * 2))
-        
+        intensity = min(1.0, count / (config.min_transitions * 2))
+
         # Find most common transition pattern
-        from_types = [t[0] for t in transitions]
-        to_types = [t[1] for t in transitions]
-        common_from = max(set(from_types), key=from_types.count)
-        common_to = max(set(to_types), key=to_types.count)
-        
+        common_from = from_counts.most_common(1)[0][0]
+        common_to = to_counts.most_common(1)[0][0]
+
         liminal = Liminality(
             liminality_type=LiminalityType.SPATIAL,
             extent_ids=(extent_id,),
@@ -90,7 +99,7 @@ def infer_liminality(
             Provenance.derivation(
                 source_ids=[],
                 operator="infer_liminality",
-                parameters={"transition_count": len(transitions)}
+                parameters={"transition_count": count}
             )
         )
         liminal_zones.append(liminal)
@@ -109,28 +118,61 @@ def detect_boundary_crossings(
     """
     if len(encounters) < 2:
         return []
-    
-    # Sort by time
-    sorted_encs = sorted(encounters, key=lambda e: e.start_time)
+
+    key = digest_encounters(encounters, sorted(extents))
+    cached = _crossings_cache.get(key)
+    if cached is not None:
+        return list(cached)
+
+    # Sort by time (argsort over a float64 buffer beats a Python key callback)
+    order = np.argsort(
+        np.fromiter(
+            (e.start_time.timestamp() for e in encounters),
+            dtype=np.float64,
+            count=len(encounters),
+        ),
+        kind="stable",
+    )
+    sorted_encs = [encounters[i] for i in order]
     crossings = []
-    
+
+    # Amortize str() conversions and hint lookups across the sweep;
+    # traces revisit the same few extents many times
+    id_strs: dict[object, str] = {}
+    type_cache: dict[str, str] = {}
+
+    def _id_str(extent_id: object) -> str | None:
+        if not extent_id:
+            return None
+        cached = id_strs.get(extent_id)
+        if cached is None:
+            cached = id_strs[extent_id] = str(extent_id)
+        return cached
+
+    def _extent_type(extent_id: str) -> str:
+        cached = type_cache.get(extent_id)
+        if cached is None:
+            cached = type_cache[extent_id] = _get_extent_type(extent_id, extents)
+        return cached
+
     for i in range(1, len(sorted_encs)):
         prev_enc = sorted_encs[i - 1]
         curr_enc = sorted_encs[i]
-        
-        prev_id = str(prev_enc.extent_id) if prev_enc.extent_id else None
-        curr_id = str(curr_enc.extent_id) if curr_enc.extent_id else None
-        
+
+        prev_id = _id_str(prev_enc.extent_id)
+        curr_id = _id_str(curr_enc.extent_id)
+
         if prev_id and curr_id and prev_id != curr_id:
             # Get extent types from semantic hints
-            prev_type = _get_extent_type(prev_id, extents)
-            curr_type = _get_extent_type(curr_id, extents)
+            prev_type = _extent_type(prev_id)
+            curr_type = _extent_type(curr_id)
             
             # Short encounters at transition point may be liminal
             if curr_enc.duration_seconds is not None and curr_enc.duration_seconds < 300:
                 crossings.append((curr_id, prev_type, curr_type))
-    
-    return crossings
+
+    _crossings_cache.put(key, crossings)
+    return list(crossings)
 
 
 def _get_extent_type(extent_id: str, extents: dict[str, SpatialExtent]) -> str:
@@ -92,19 +92,26 @@ def derive_meaning_from_practices(
         Derived meanings.
     """
     meanings = []
-    
-    # Analyze practice patterns
-    routine_count = sum(1 for p in practices if p.is_routine)
-    habit_count = sum(1 for p in practices if p.is_habit)
-    total_encounters = sum(p.encounter_count for p in practices)
-    
+
+    # Analyze practice patterns in a single pass: tally counts, sum
+    # encounters, and track the dominant routine as we go
+    routine_count = 0
+    habit_count = 0
+    total_encounters = 0
+    dominant_practice: Practice | None = None
+
+    for p in practices:
+        if p.is_routine:
+            routine_count += 1
+            if (dominant_practice is None or
+                    p.encounter_count > dominant_practice.encounter_count):
+                dominant_practice = p
+        if p.is_habit:
+            habit_count += 1
+        total_encounters += p.encounter_count
+
     # Derive functional meaning from routine use
-    if routine_count > 0:
-        dominant_practice = max(
-            [p for p in practices if p.is_routine],
-            key=lambda p: p.encounter_count
-        )
-        
+    if dominant_practice is not None:
         meaning = Meaning(
             meaning_type=MeaningType.FUNCTIONAL,
             agent_id=agent_id,
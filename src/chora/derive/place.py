@@ -11,10 +11,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Sequence
 
-from chora.core.types import NodeType, EdgeType, AgentId, ExtentId
+from chora.core.types import NodeType, EdgeType, AgentId, ExtentId, NodeId
 from chora.core.graph import PlatialGraph
 from chora.core.spatial_extent import SpatialExtent
 from chora.core.familiarity import Familiarity
+from chora.core.affect import Affect
+from chora.core.meaning import Meaning
 
 
 @dataclass
@@ -87,11 +89,15 @@ def extract_place(
     EmergentPlace
         The emergent place structure.
     """
+    # Stringify the loop-invariant ID once; every index probe below
+    # takes the same key
+    extent_str = str(extent_id)
+    extent_node_id = NodeId(extent_str)
+
     # Get the extent node
-    from chora.core.types import NodeId
     extent = None
     try:
-        node = graph.get_node(NodeId(str(extent_id)))
+        node = graph.get_node(extent_node_id)
         if isinstance(node, SpatialExtent):
             extent = node
     except Exception:
@@ -108,52 +114,47 @@ def extract_place(
     if extent:
         subgraph.add_node(extent)
     
-    # Find encounters at this extent
-    for edge in graph.edges(EdgeType.OCCURS_AT):
-        if str(edge.target_id) == str(extent_id):
+    if agent_id is not None:
+        # The (agent, extent) partition already holds exactly the
+        # encounters we want — no per-encounter agent_id re-test
+        for encounter in graph.encounters_for_agent_extent(agent_id, extent_str):
+            subgraph.add_node(encounter)
+            encounter_ids.append(encounter.id)
+    else:
+        # Find encounters at this extent via the incoming-edge index
+        for edge in graph.incoming_edges(extent_node_id, EdgeType.OCCURS_AT):
             encounter_id = edge.source_id
             try:
                 encounter = graph.get_node(encounter_id)
-                # Filter by agent if specified
-                if agent_id is not None:
-                    from chora.core.encounter import Encounter
-                    if isinstance(encounter, Encounter):
-                        if encounter.agent_id != agent_id:
-                            continue
-                
                 subgraph.add_node(encounter)
                 encounter_ids.append(encounter_id)
             except Exception:
                 pass
-    
-    # Find familiarities
-    for node in graph.nodes(NodeType.FAMILIARITY):
+
+    # Find familiarities referencing this extent
+    for node in graph.nodes_for_extent(extent_str, NodeType.FAMILIARITY):
         if isinstance(node, Familiarity):
-            if str(node.extent_id) == str(extent_id):
-                if agent_id is None or node.agent_id == agent_id:
-                    familiarities.append(node.current_value)
-                    subgraph.add_node(node)
-    
-    # Find affects linked to encounters
-    for edge in graph.edges(EdgeType.EXPRESSES):
-        if edge.source_id in encounter_ids:
+            if agent_id is None or node.agent_id == agent_id:
+                familiarities.append(node.current_value)
+                subgraph.add_node(node)
+
+    # Find affects linked to encounters via their outgoing edges
+    for encounter_id in encounter_ids:
+        for edge in graph.outgoing_edges(encounter_id, EdgeType.EXPRESSES):
             try:
                 affect = graph.get_node(edge.target_id)
-                from chora.core.affect import Affect
                 if isinstance(affect, Affect):
                     affect_values.append(affect.valence)
                     subgraph.add_node(affect)
             except Exception:
                 pass
-    
-    # Find meanings
-    for node in graph.nodes(NodeType.MEANING):
-        from chora.core.meaning import Meaning
+
+    # Find meanings referencing this extent
+    for node in graph.nodes_for_extent(extent_str, NodeType.MEANING):
         if isinstance(node, Meaning):
-            if str(node.extent_id) == str(extent_id):
-                if agent_id is None or node.agent_id == agent_id or node.is_shared:
-                    meaning_count += 1
-                    subgraph.add_node(node)
+            if agent_id is None or node.agent_id == agent_id or node.is_shared:
+                meaning_count += 1
+                subgraph.add_node(node)
     
     # Compute aggregates
     familiarity_score = sum(familiarities) / len(familiarities) if familiarities else 0.0
@@ -180,21 +181,27 @@ def find_emergent_places(
     
     Returns places that have sufficient activity to be meaningful.
     """
-    # Get all spatial extents
-    extent_ids: set[str] = set()
-    
-    for node in graph.nodes(NodeType.SPATIAL_EXTENT):
-        extent_ids.add(str(node.id))
+    # Get all spatial extents from the shared per-version snapshot
+    snapshot = graph.snapshot_by_type(NodeType.SPATIAL_EXTENT)
+    extent_ids = {str(node.id) for node in snapshot[NodeType.SPATIAL_EXTENT]}
     
-    # Extract places
+    # Extract places, skipping extents whose total encounter count is
+    # already below threshold — the agent-filtered count can only be
+    # smaller, so this avoids building throwaway subgraphs
     places = []
     for extent_id in extent_ids:
+        if graph.encounter_count_for_extent(extent_id) < min_encounters:
+            continue
         place = extract_place(graph, ExtentId(extent_id), agent_id)
         if place.encounter_count >= min_encounters:
             places.append(place)
     
-    # Sort by significance
-    places.sort(key=lambda p: (p.familiarity_score + p.encounter_count / 10), 
-                reverse=True)
-    
-    return places
+    # Sort by significance, decorating with the score once instead of
+    # paying attribute access inside the key callback
+    scored = [
+        (p.familiarity_score + p.encounter_count * 0.1, i, p)
+        for i, p in enumerate(places)
+    ]
+    scored.sort(key=lambda t: (-t[0], t[1]))
+
+    return [p for _, _, p in scored]
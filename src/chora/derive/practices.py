@@ -6,21 +6,45 @@ Detect emergent practices via sequence and motif analysis.
 
 from __future__ import annotations
 
+import math
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Sequence
 
+import numpy as np
+
 from chora.core.types import AgentId, ExtentId, PracticeType, EpistemicLevel
 from chora.core.encounter import Encounter
 from chora.core.practice import Practice
 from chora.core.provenance import Provenance
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _circular_resultant(hours: np.ndarray) -> float:
+        # Fused single pass: no angle/cos/sin temporaries, SIMD-friendly
+        s = 0.0
+        c = 0.0
+        k = 0.2617993877991494  # 2*pi / 24 hours
+        n = hours.shape[0]
+        for i in range(n):
+            a = hours[i] * k
+            s += math.sin(a)
+            c += math.cos(a)
+        return math.hypot(s / n, c / n)
+else:
+    _circular_resultant = None
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PracticeDetectionConfig:
     """Configuration for practice detection."""
-    
+
     # Minimum occurrences for a routine
     min_occurrences: int = 3
     # Time window for considering patterns
@@ -31,6 +55,81 @@ class PracticeDetectionConfig:
     min_regularity: float = 0.5
 
 
+@dataclass(slots=True)
+class _EncounterFrame:
+    """
+    Structure-of-arrays view over a list of encounters.
+
+    One pass over the input materializes every field the detection
+    functions touch into parallel contiguous buffers, so the hot loops
+    index arrays instead of repeating per-Encounter attribute lookups.
+    Extent ids are interned to small ints via ``extent_table``; -1
+    marks a missing extent.
+    """
+
+    encounters: list[Encounter]
+    agent_ids: np.ndarray       # object
+    extent_idx: np.ndarray      # int32, -1 for missing
+    extent_table: list[str]
+    start_epoch: np.ndarray     # int64 seconds
+    day_ord: np.ndarray         # int32 ordinal day
+    hour_frac: np.ndarray       # float64 decimal hour
+    hour_bucket: np.ndarray     # int8 4-hour bucket
+
+    @classmethod
+    def from_encounters(cls, encounters: Sequence[Encounter]) -> _EncounterFrame:
+        n = len(encounters)
+        agent_ids = np.empty(n, dtype=object)
+        extent_idx = np.empty(n, dtype=np.int32)
+        start_epoch = np.empty(n, dtype=np.int64)
+        day_ord = np.empty(n, dtype=np.int32)
+        hour_frac = np.empty(n, dtype=np.float64)
+        hour_bucket = np.empty(n, dtype=np.int8)
+
+        id_to_idx: dict[str, int] = {}
+        for i, enc in enumerate(encounters):
+            agent_ids[i] = str(enc.agent_id)
+            if enc.extent_id is None:
+                extent_idx[i] = -1
+            else:
+                extent_idx[i] = id_to_idx.setdefault(
+                    str(enc.extent_id), len(id_to_idx)
+                )
+            start = enc.start_time
+            start_epoch[i] = enc.start_epoch
+            day_ord[i] = start.toordinal()
+            hour_frac[i] = start.hour + start.minute / 60
+            hour_bucket[i] = enc.hour_bucket  # cached 4-hour bucket
+
+        return cls(
+            encounters=list(encounters),
+            agent_ids=agent_ids,
+            extent_idx=extent_idx,
+            extent_table=list(id_to_idx),
+            start_epoch=start_epoch,
+            day_ord=day_ord,
+            hour_frac=hour_frac,
+            hour_bucket=hour_bucket,
+        )
+
+    def __len__(self) -> int:
+        return len(self.encounters)
+
+    def select(self, mask: np.ndarray) -> _EncounterFrame:
+        """Return a sliced frame; the extent table is shared, not rebuilt."""
+        keep = np.flatnonzero(mask)
+        return _EncounterFrame(
+            encounters=[self.encounters[i] for i in keep],
+            agent_ids=self.agent_ids[keep],
+            extent_idx=self.extent_idx[keep],
+            extent_table=self.extent_table,
+            start_epoch=self.start_epoch[keep],
+            day_ord=self.day_ord[keep],
+            hour_frac=self.hour_frac[keep],
+            hour_bucket=self.hour_bucket[keep],
+        )
+
+
 def detect_practices(
     encounters: Sequence[Encounter],
     agent_id: AgentId,
@@ -58,21 +157,34 @@ def detect_practices(
     """
     if config is None:
         config = PracticeDetectionConfig()
-    
-    # Filter to agent
-    agent_encounters = [e for e in encounters if e.agent_id == agent_id]
-    
-    if len(agent_encounters) < config.min_occurrences:
+
+    # Cheap rejections before any frame is built: too few encounters
+    # overall, or too few for this agent (counted with an early break)
+    if len(encounters) < config.min_occurrences:
         return []
-    
+    agent_key = str(agent_id)
+    matched = 0
+    for enc in encounters:
+        if str(enc.agent_id) == agent_key:
+            matched += 1
+            if matched >= config.min_occurrences:
+                break
+    else:
+        return []
+
+    # Build the SoA frame once and filter to the agent with one
+    # vectorized comparison; both detectors then share the buffers
+    frame = _EncounterFrame.from_encounters(encounters)
+    agent_frame = frame.select(frame.agent_ids == agent_key)
+
     practices = []
-    
+
     # Detect location-based routines
-    routines = detect_routines(agent_encounters, config)
+    routines = _detect_routines_frame(agent_frame, config)
     practices.extend(routines)
-    
+
     # Detect sequence patterns
-    sequences = find_sequence_patterns(agent_encounters, config)
+    sequences = _find_sequence_patterns_frame(agent_frame, config)
     for pattern_name, enc_ids, regularity in sequences:
         practice = Practice(
             practice_type=PracticeType.ROUTINE,
@@ -104,30 +216,53 @@ def detect_routines(
     """
     if config is None:
         config = PracticeDetectionConfig()
-    
-    # Group by extent and time-of-day bucket
-    patterns: dict[tuple[str, int], list[Encounter]] = defaultdict(list)
-    
-    for enc in encounters:
-        if enc.extent_id is None:
-            continue
-        
-        hour_bucket = enc.start_time.hour // 4  # 4-hour buckets
-        key = (str(enc.extent_id), hour_bucket)
-        patterns[key].append(enc)
-    
+    return _detect_routines_frame(
+        _EncounterFrame.from_encounters(encounters), config
+    )
+
+
+def _detect_routines_frame(
+    frame: _EncounterFrame,
+    config: PracticeDetectionConfig
+) -> list[Practice]:
+    """Routine detection over a prebuilt SoA frame."""
+    frame = frame.select(frame.extent_idx >= 0)
+    n = len(frame)
+    if n == 0:
+        return []
+
+    # Group (extent, time-of-day bucket) with a single lexsort over the
+    # frame's buffers instead of per-encounter dict inserts
+    extent_idx = frame.extent_idx
+    hour_bucket = frame.hour_bucket
+
+    order = np.lexsort((hour_bucket, extent_idx))
+    group_key = extent_idx[order].astype(np.int64) * 8 + hour_bucket[order]
+    bounds = np.concatenate(
+        ([0], np.flatnonzero(np.diff(group_key)) + 1, [n])
+    )
+
     routines = []
-    
-    for (extent_id, hour_bucket), pattern_encounters in patterns.items():
-        if len(pattern_encounters) < config.min_occurrences:
+
+    # Hoist config reads out of the per-group loop
+    min_occurrences = config.min_occurrences
+    min_regularity = config.min_regularity
+
+    for b in range(len(bounds) - 1):
+        lo, hi = bounds[b], bounds[b + 1]
+        if hi - lo < min_occurrences:
             continue
-        
-        # Calculate regularity
-        regularity = _calculate_regularity(pattern_encounters)
-        
-        if regularity >= config.min_regularity:
-            time_label = _hour_bucket_to_label(hour_bucket)
-            
+
+        group = order[lo:hi]
+
+        # Calculate regularity on the contiguous group slice
+        regularity = circular_regularity(frame.hour_frac[group])
+
+        if regularity >= min_regularity:
+            pattern_encounters = [frame.encounters[i] for i in group]
+            extent_id = frame.extent_table[extent_idx[group[0]]]
+            time_label = _hour_bucket_to_label(int(hour_bucket[group[0]]))
+
             practice = Practice(
                 practice_type=PracticeType.ROUTINE,
                 name=f"{time_label} visit to {extent_id}",
@@ -144,7 +279,7 @@ def detect_routines(
                 )
             )
             routines.append(practice)
-    
+
     return routines
 
 
@@ -159,34 +294,65 @@ def find_sequence_patterns(
     """
     if config is None:
         config = PracticeDetectionConfig()
-    
-    # Sort encounters by time
-    sorted_encs = sorted(encounters, key=lambda e: e.start_time)
-    
-    # Find bigram patterns
-    bigrams: dict[tuple[str, str], list[tuple[str, str]]] = defaultdict(list)
-    
-    for i in range(len(sorted_encs) - 1):
-        enc1, enc2 = sorted_encs[i], sorted_encs[i + 1]
-        
-        if enc1.extent_id is None or enc2.extent_id is None:
-            continue
-        
-        # Check if they're on the same day
-        if enc1.start_time.date() == enc2.start_time.date():
-            key = (str(enc1.extent_id), str(enc2.extent_id))
-            bigrams[key].append((str(enc1.id), str(enc2.id)))
-    
+    return _find_sequence_patterns_frame(
+        _EncounterFrame.from_encounters(encounters), config
+    )
+
+
+def _find_sequence_patterns_frame(
+    frame: _EncounterFrame,
+    config: PracticeDetectionConfig
+) -> list[tuple[str, list[str], float]]:
+    """Sequence-pattern detection over a prebuilt SoA frame."""
+    n = len(frame)
+    if n < 2:
+        return []
+
+    # Sort by (agent, start time) so each agent's history is a
+    # contiguous, chronologically ordered run; lexsort keeps both keys
+    # in one C-level pass
+    _, agent_code = np.unique(frame.agent_ids, return_inverse=True)
+    order = np.lexsort((frame.start_epoch, agent_code))
+    agent_code = agent_code[order]
+    extent_idx = frame.extent_idx[order]
+    day_ord = frame.day_ord[order]
+
+    # A bigram counts when both extents are known, the pair belongs to
+    # the same agent, and falls on the same day; the histogram is a
+    # sort-based groupby in C instead of hashing str-tuple keys per pair
+    valid = (
+        (extent_idx[:-1] >= 0)
+        & (extent_idx[1:] >= 0)
+        & (agent_code[:-1] == agent_code[1:])
+        & (day_ord[:-1] == day_ord[1:])
+    )
+    pair_pos = np.flatnonzero(valid)
+    if pair_pos.size == 0:
+        return []
+
+    # Pack each (src, dst) pair into one int64 code; the histogram is
+    # then a single bincount over small ints rather than np.unique over
+    # two-column rows (which compares them as void records)
+    n_extents = len(frame.extent_table)
+    pair_code = (
+        extent_idx[pair_pos].astype(np.int64) * n_extents
+        + extent_idx[pair_pos + 1]
+    )
+    counts = np.bincount(pair_code)
+
     patterns = []
-    
-    for (loc1, loc2), instances in bigrams.items():
-        if len(instances) >= config.min_occurrences:
-            regularity = len(instances) / len(sorted_encs)
-            enc_ids = [eid for pair in instances for eid in pair]
-            patterns.append(
-                (f"{loc1} → {loc2}", enc_ids, regularity)
-            )
-    
+
+    # Materialize encounter-id lists only for surviving bigrams
+    for code in np.flatnonzero(counts >= config.min_occurrences):
+        enc_ids = []
+        for i in pair_pos[pair_code == code]:
+            enc_ids.append(str(frame.encounters[order[i]].id))
+            enc_ids.append(str(frame.encounters[order[i + 1]].id))
+        src, dst = divmod(int(code), n_extents)
+        loc1 = frame.extent_table[src]
+        loc2 = frame.extent_table[dst]
+        patterns.append((f"{loc1} → {loc2}", enc_ids, int(counts[code]) / n))
+
     return patterns
 
 
@@ -194,27 +360,62 @@ def _calculate_regularity(encounters: Sequence[Encounter]) -> float:
     """Calculate regularity score based on timing consistency."""
     if len(encounters) < 2:
         return 0.0
-    
-    # Calculate std of start times (hour + minute/60)
-    times = [e.start_time.hour + e.start_time.minute / 60 for e in encounters]
-    mean_time = sum(times) / len(times)
-    variance = sum((t - mean_time) ** 2 for t in times) / len(times)
-    std = variance ** 0.5
-    
-    # Convert to regularity score (lower std = higher regularity)
-    # Max std is about 12 hours (half day)
-    regularity = max(0, 1 - std / 6)
-    return regularity
+
+    # Std of start times (hour + minute/60), reduced in one vectorized
+    # pass over a contiguous buffer
+    times = np.fromiter(
+        (e.start_time.hour + e.start_time.minute / 60 for e in encounters),
+        dtype=np.float64,
+        count=len(encounters),
+    )
+    return circular_regularity(times)
+
+
+def circular_regularity(hours: np.ndarray) -> float:
+    """
+    Score timing consistency for a buffer of decimal hours.
+
+    Uses the circular mean resultant length
+    ``R = |mean(exp(i * 2*pi * hour / 24))|``: 1.0 when every visit
+    falls at the same time of day, 0.0 when times are spread uniformly.
+    Unlike a plain standard deviation this treats the clock as a
+    circle, so 23:30 and 00:30 score as an hour apart rather than 23.
+
+    Parameters
+    ----------
+    hours : np.ndarray
+        Decimal hours of day (float64), one per visit.
+
+    Returns
+    -------
+    float
+        Regularity score in [0, 1].
+    """
+    if hours.size == 0:
+        return 0.0
+    if _circular_resultant is not None:
+        # numba is optional; when present the fused kernel avoids the
+        # angle/cos/sin intermediates of the NumPy chain below
+        resultant = float(_circular_resultant(hours))
+    else:
+        angles = hours * (math.pi / 12.0)  # 2*pi / 24 hours
+        resultant = float(np.hypot(np.cos(angles).mean(), np.sin(angles).mean()))
+    # hypot can land a few ulps above 1.0 for perfectly aligned times
+    return min(resultant, 1.0)
+
+
+_HOUR_LABELS: tuple[str, ...] = (
+    "night (0-4)",
+    "early morning (4-8)",
+    "morning (8-12)",
+    "afternoon (12-16)",
+    "evening (16-20)",
+    "night (20-24)",
+)
 
 
 def _hour_bucket_to_label(bucket: int) -> str:
     """Convert 4-hour bucket to label."""
-    labels = {
-        0: "night (0-4)",
-        1: "early morning (4-8)",
-        2: "morning (8-12)",
-        3: "afternoon (12-16)",
-        4: "evening (16-20)",
-        5: "night (20-24)",
-    }
-    return labels.get(bucket, f"time bucket {bucket}")
+    if 0 <= bucket < len(_HOUR_LABELS):
+        return _HOUR_LABELS[bucket]
+    return f"time bucket {bucket}"
@@ -3,41 +3,126 @@ Local Embedding Model using Sentence Transformers.
 
 Uses 'all-MiniLM-L6-v2' by default (small, fast, good quality).
 """
+import threading
+from collections import OrderedDict
 from typing import List
 from typing import Protocol
 
+import numpy as np
+
 class Embedder(Protocol):
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         ...
 
+class QuantizedVector(np.ndarray):
+    """An int8 embedding carrying its symmetric per-vector scale."""
+
+    scale: float = 1.0
+
+    def __array_finalize__(self, obj):
+        if obj is not None:
+            self.scale = getattr(obj, "scale", 1.0)
+
+
+def quantize_vector(vector: np.ndarray) -> QuantizedVector:
+    """
+    Quantize a float32 embedding to int8 with a per-vector scale.
+
+    384 bytes instead of 1536 per MiniLM vector; similarity search over
+    int8 rows stays within ~1% recall of full precision.
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    scale = float(np.max(np.abs(v))) / 127.0 if v.size else 1.0
+    if scale == 0.0:
+        scale = 1.0
+    quantized = np.round(v / scale).astype(np.int8).view(QuantizedVector)
+    quantized.scale = scale
+    return quantized
+
+
+def dequantize_vector(vector: np.ndarray) -> np.ndarray:
+    """Recover a float32 vector from a quantized one (no-op scale=1 otherwise)."""
+    scale = getattr(vector, "scale", 1.0)
+    return np.asarray(vector, dtype=np.float32) * scale
+
+
 class LocalEmbedder:
     """
     Real local embedding using HuggingFace SentenceTransformers.
     """
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # Repeated texts (e.g. identical context strings) skip the model
+    _CACHE_SIZE = 8192
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", quantize: bool = False):
         try:
             from sentence_transformers import SentenceTransformer
             self._model = SentenceTransformer(model_name)
         except ImportError:
             raise ImportError("sentence-transformers not installed. Install with `pip install .[server]`")
+        self.quantize = quantize
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def embed_text(self, text: str) -> np.ndarray:
+        """
+        Convert text to a contiguous float32 vector.
+
+        With ``quantize=True`` the returned vector is int8 with a
+        symmetric per-vector scale stored on the array (see
+        :func:`quantize_vector`) — 4x smaller in cache and on the wire;
+        call :func:`dequantize_vector` to recover float32.
+        """
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
 
-    def embed_text(self, text: str) -> List[float]:
-        """Convert text to a vector (list of floats)."""
-        # encode returns numpy array, convert to list
-        vector = self._model.encode(text)
-        return vector.tolist()
+        # Keep the compact float32 buffer; a Python list of floats is
+        # ~7x larger and loses vectorized similarity downstream.
+        # Unit-normalized at encode time, so cosine similarity between
+        # returned vectors is a plain dot product — callers can skip
+        # the norms.
+        vector = np.asarray(
+            self._model.encode(text, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+        if self.quantize:
+            vector = quantize_vector(vector)
+
+        self._cache[text] = vector
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return vector
+
+    def embed_texts(self, texts: List[str]):
+        """
+        Convert a batch of texts to an (n, dim) numpy array.
+
+        Batching amortizes tokenization and the transformer forward
+        pass across all texts; prefer this over per-text embed_text
+        calls for bulk workloads. Rows are unit-normalized, matching
+        :meth:`embed_text`.
+        """
+        return self._model.encode(
+            list(texts), batch_size=32, convert_to_numpy=True,
+            normalize_embeddings=True
+        )
 
 _global_embedder = None
+_embedder_lock = threading.Lock()
 
 def get_embedding_model() -> Embedder:
     """Factory to get the configured embedding model (Singleton)."""
     global _global_embedder
     if _global_embedder is None:
-        # Lazy load to avoid overhead on import
-        try:
-            _global_embedder = LocalEmbedder()
-        except ImportError:
-            # Fallback for dev environment without deps? 
-            # User explicitly asked for REAL embedder, so we should error if missing.
-            raise ImportError("Real Embedder requested but sentence-transformers missing.")
+        # Double-checked lock: concurrent first calls (e.g. parallel
+        # server requests) must not each load the model
+        with _embedder_lock:
+            if _global_embedder is None:
+                # Lazy load to avoid overhead on import
+                try:
+                    _global_embedder = LocalEmbedder()
+                except ImportError:
+                    # Fallback for dev environment without deps?
+                    # User explicitly asked for REAL embedder, so we should error if missing.
+                    raise ImportError("Real Embedder requested but sentence-transformers missing.")
     return _global_embedder
@@ -5,12 +5,23 @@ Generate natural language narratives about places using large language models.
 """
 from __future__ import annotations
 
+import asyncio
+import http.client
+import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Iterator, Protocol
+from urllib.parse import urlsplit
 from abc import ABC, abstractmethod
 
 from chora.core import PlatialGraph, SpatialExtent
 from chora.core.types import NodeType, NodeId
+from chora.llm._cache import PromptCache, prompt_key
+
+# Shared across generator instances: the same (model, temperature,
+# prompt) triple yields the same text wherever it is issued from
+_prompt_cache = PromptCache()
 
 
 # =============================================================================
@@ -52,7 +63,24 @@ class OpenAIProvider:
             temperature=kwargs.get("temperature", self.temperature),
             max_tokens=kwargs.get("max_tokens", self.max_tokens)
         )
-        
+
+        return response.choices[0].message.content or ""
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("openai not installed. Run: pip install openai")
+
+        client = AsyncOpenAI(api_key=self.api_key or None)
+
+        response = await client.chat.completions.create(
+            model=kwargs.get("model", self.model),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens)
+        )
+
         return response.choices[0].message.content or ""
 
 
@@ -78,39 +106,119 @@ class AnthropicProvider:
             max_tokens=kwargs.get("max_tokens", self.max_tokens),
             messages=[{"role": "user", "content": prompt}]
         )
-        
+
+        return message.content[0].text if message.content else ""
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError("anthropic not installed. Run: pip install anthropic")
+
+        client = anthropic.AsyncAnthropic(api_key=self.api_key or None)
+
+        message = await client.messages.create(
+            model=kwargs.get("model", self.model),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
+            messages=[{"role": "user", "content": prompt}]
+        )
+
         return message.content[0].text if message.content else ""
 
 
+# Keep-alive connections to Ollama, one per host. Reusing the socket
+# avoids a TCP handshake per generate() call; each host gets its own
+# lock since a connection can only carry one request at a time, but
+# requests to different hosts need not serialize each other.
+_OLLAMA_CONNECTIONS: dict[str, http.client.HTTPConnection] = {}
+_OLLAMA_LOCKS: dict[str, threading.Lock] = {}
+
+
+def _ollama_lock(netloc: str) -> threading.Lock:
+    """Get (or create) the connection lock for a host."""
+    # dict.setdefault is atomic, so two threads racing here still
+    # agree on a single lock per host
+    return _OLLAMA_LOCKS.setdefault(netloc, threading.Lock())
+
+
+def _ollama_connection(base_url: str) -> http.client.HTTPConnection:
+    """Get (or open) the persistent connection for a base URL."""
+    parts = urlsplit(base_url)
+    conn = _OLLAMA_CONNECTIONS.get(parts.netloc)
+    if conn is None:
+        conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = conn_cls(parts.netloc, timeout=120)
+        _OLLAMA_CONNECTIONS[parts.netloc] = conn
+    return conn
+
+
 @dataclass
 class OllamaProvider:
     """Local Ollama provider."""
-    
+
     model: str = "llama3.2"
     base_url: str = "http://localhost:11434"
-    
+
     def generate(self, prompt: str, **kwargs) -> str:
-        import json
-        import urllib.request
-        
+        return "".join(self._request_tokens(prompt, **kwargs))
+
+    def generate_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Generate text, yielding the response token by token.
+
+        The whole response is read under the per-host connection lock
+        before the first yield: suspending a generator mid-stream would
+        otherwise keep the lock held until the caller resumes — or
+        forever, if the generator is abandoned half-consumed.
+        """
+        yield from self._request_tokens(prompt, **kwargs)
+
+    def _request_tokens(self, prompt: str, **kwargs) -> list[str]:
+        """Issue one generate request and collect the token stream."""
         data = {
             "model": kwargs.get("model", self.model),
             "prompt": prompt,
-            "stream": False
+            "stream": True
         }
-        
-        req = urllib.request.Request(
-            f"{self.base_url}/api/generate",
-            data=json.dumps(data).encode(),
-            headers={"Content-Type": "application/json"}
-        )
-        
-        try:
-            with urllib.request.urlopen(req, timeout=60) as response:
-                result = json.loads(response.read().decode())
-                return result.get("response", "")
-        except Exception as e:
-            return f"Error: {e}"
+
+        parts = urlsplit(self.base_url)
+        tokens: list[str] = []
+        with _ollama_lock(parts.netloc):
+            conn = _ollama_connection(self.base_url)
+            try:
+                conn.request(
+                    "POST",
+                    "/api/generate",
+                    body=json.dumps(data).encode(),
+                    headers={"Content-Type": "application/json"}
+                )
+                response = conn.getresponse()
+                for line in response:
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    token = chunk.get("response", "")
+                    if token:
+                        tokens.append(token)
+                    if chunk.get("done"):
+                        break
+                # Drain so the connection is clean for the next request
+                response.read()
+            except Exception as e:
+                # A stale keep-alive socket is not reusable; drop it so
+                # the next call reconnects
+                conn.close()
+                _OLLAMA_CONNECTIONS.pop(parts.netloc, None)
+                tokens.append(f"Error: {e}")
+        return tokens
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        # A local Ollama server processes requests sequentially, so a
+        # worker thread around the sync path is as concurrent as it gets
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
 
 
 # =============================================================================
@@ -127,7 +235,36 @@ class NarrativeGenerator:
     """
     
     provider: LLMProvider = field(default_factory=OllamaProvider)
-    
+    # Sampling at temperature > 0 makes repeat prompts legitimately
+    # diverge; set deterministic=True to memoize them anyway
+    deterministic: bool = False
+    _context_cache: OrderedDict = field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    _CONTEXT_CACHE_SIZE = 256
+
+    def _cacheable(self) -> bool:
+        # A provider without a temperature attribute (e.g. Ollama,
+        # which samples at the server's default) is NOT deterministic;
+        # only an explicit 0.0 makes repeat prompts reproducible
+        temperature = getattr(self.provider, "temperature", None)
+        return self.deterministic or temperature == 0.0
+
+    def _generate(self, prompt: str) -> str:
+        """Generate with prompt-level memoization where sound."""
+        if not self._cacheable():
+            return self.provider.generate(prompt)
+
+        key = prompt_key(self.provider, prompt)
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = self.provider.generate(prompt)
+        _prompt_cache.put(key, text)
+        return text
+
     def describe_place(
         self, 
         graph: PlatialGraph, 
@@ -148,8 +285,44 @@ class NarrativeGenerator:
         """
         context = self._gather_context(graph, extent)
         prompt = self._build_describe_prompt(context, style)
-        return self.provider.generate(prompt)
-    
+        return self._generate(prompt)
+
+    async def adescribe_place(
+        self,
+        graph: PlatialGraph,
+        extent: SpatialExtent,
+        style: str = "descriptive"
+    ) -> str:
+        """Async variant of :meth:`describe_place`."""
+        context = self._gather_context(graph, extent)
+        prompt = self._build_describe_prompt(context, style)
+
+        agenerate = getattr(self.provider, "agenerate", None)
+        if agenerate is not None:
+            return await agenerate(prompt)
+        # Provider only implements the sync protocol; run it off-loop
+        return await asyncio.to_thread(self.provider.generate, prompt)
+
+    def describe_places_batch(
+        self,
+        graph: PlatialGraph,
+        extents: list[SpatialExtent],
+        style: str = "descriptive"
+    ) -> list[str]:
+        """
+        Describe many places concurrently.
+
+        LLM calls are latency-bound, not CPU-bound, so fanning the
+        independent per-extent requests out with asyncio.gather scales
+        with provider concurrency rather than summing round-trips.
+        """
+        async def _run() -> list[str]:
+            return list(await asyncio.gather(
+                *(self.adescribe_place(graph, ext, style) for ext in extents)
+            ))
+
+        return asyncio.run(_run())
+
     def compare_places(
         self,
         graph: PlatialGraph,
@@ -171,7 +344,7 @@ Place 2: {ctx2['name']}
 Write a brief comparison highlighting how these places differ in terms of 
 character, atmosphere, and the experiences they afford. Keep it to 2-3 paragraphs."""
         
-        return self.provider.generate(prompt)
+        return self._generate(prompt)
     
     def narrate_journey(
         self,
@@ -193,7 +366,7 @@ Create an engaging first-person narrative (2-3 paragraphs) that captures the
 experience of moving through these places, noting the transitions and how 
 each place feels different."""
         
-        return self.provider.generate(prompt)
+        return self._generate(prompt)
     
     def interpret_familiarity(
         self,
@@ -218,7 +391,7 @@ This means the place is {level} to them. Write 2-3 sentences interpreting
 what this level of familiarity might feel like and mean for their relationship 
 with this place."""
         
-        return self.provider.generate(prompt)
+        return self._generate(prompt)
     
     def suggest_exploration(
         self,
@@ -239,7 +412,7 @@ Suggest which unfamiliar places might be interesting to explore and why,
 based on the pattern of places they already know. Be specific and give 
 reasons. Keep it to 2-3 suggestions."""
         
-        return self.provider.generate(prompt)
+        return self._generate(prompt)
     
     def _gather_context(
         self, 
@@ -247,6 +420,14 @@ reasons. Keep it to 2-3 suggestions."""
         extent: SpatialExtent
     ) -> dict[str, Any]:
         """Gather contextual information about a place."""
+        # Journeys and comparisons revisit the same extents; reuse the
+        # context until the graph mutates
+        cache_key = (id(graph), graph.version, str(extent.id))
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            self._context_cache.move_to_end(cache_key)
+            return cached
+
         context = {
             "name": extent.name or "unnamed place",
             "type": extent.extent_type,
@@ -255,23 +436,25 @@ reasons. Keep it to 2-3 suggestions."""
             "activities": set(),
             "affect": None
         }
-        
-        # Count encounters
-        for node in graph.nodes(NodeType.ENCOUNTER):
-            if hasattr(node, 'extent_id') and str(node.extent_id) == str(extent.id):
-                context["encounter_count"] += 1
-                if hasattr(node, 'activity'):
-                    context["activities"].add(node.activity)
-        
+
+        # Count encounters via the extent index instead of scanning
+        # every node in the graph per place described
+        for node in graph.nodes_for_extent(extent.id, NodeType.ENCOUNTER):
+            context["encounter_count"] += 1
+            if hasattr(node, 'activity'):
+                context["activities"].add(node.activity)
+
         # Get affect if available
-        for node in graph.nodes(NodeType.AFFECT):
-            if hasattr(node, 'extent_id') and str(node.extent_id) == str(extent.id):
-                context["affect"] = {
-                    "valence": getattr(node, 'valence', 0),
-                    "arousal": getattr(node, 'arousal', 0)
-                }
-                break
-        
+        for node in graph.nodes_for_extent(extent.id, NodeType.AFFECT):
+            context["affect"] = {
+                "valence": getattr(node, 'valence', 0),
+                "arousal": getattr(node, 'arousal', 0)
+            }
+            break
+
+        self._context_cache[cache_key] = context
+        if len(self._context_cache) > self._CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
         return context
     
     def _format_context(self, ctx: dict) -> str:
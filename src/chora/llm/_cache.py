@@ -0,0 +1,55 @@
+"""
+Prompt Memoization
+
+Bounded LRU cache for completed LLM generations. Sessions that describe
+the same place repeatedly (or re-run a journey narrative) re-issue
+byte-identical prompts; skipping the round-trip is free.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+# Generations are short strings; 1024 entries is a few MB at most
+_CACHE_SIZE = 1024
+
+
+def prompt_key(provider: object, prompt: str) -> tuple[str, float | None, str]:
+    """
+    Cache key for a generation request.
+
+    Keyed on (model, temperature, prompt digest) so the same prompt sent
+    to a different model or at a different temperature misses. A provider
+    without a temperature attribute keys as ``None`` — an unknown
+    temperature is not the same as sampling at 0.0.
+    """
+    digest = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+    temperature = getattr(provider, "temperature", None)
+    return (
+        str(getattr(provider, "model", "")),
+        float(temperature) if temperature is not None else None,
+        digest,
+    )
+
+
+class PromptCache:
+    """LRU map from :func:`prompt_key` tuples to generated text."""
+
+    def __init__(self, maxsize: int = _CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+
+    def get(self, key: tuple) -> str | None:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: tuple, text: str) -> None:
+        self._entries[key] = text
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -8,7 +8,7 @@ from typing import Sequence
 
 from chora.core.graph import PlatialGraph
 from chora.core.practice import Practice
-from chora.core.types import NodeType
+from chora.core.types import NodeType, PracticeType
 
 
 def find_practices_like(
@@ -17,17 +17,17 @@ def find_practices_like(
     min_similarity: float = 0.5
 ) -> list[Practice]:
     """Find practices similar to a template."""
-    matches = []
-    
-    for node in graph.nodes(NodeType.PRACTICE):
-        if not isinstance(node, Practice):
-            continue
-        
-        sim = _practice_similarity(template, node)
-        if sim >= min_similarity:
-            matches.append(node)
-    
-    return sorted(matches, key=lambda p: _practice_similarity(template, p), reverse=True)
+    # Score each candidate once and sort on the cached value rather
+    # than recomputing the similarity inside the sort key. The typed
+    # snapshot holds only Practice nodes, so no isinstance re-check.
+    practices = graph.snapshot_by_type(NodeType.PRACTICE)[NodeType.PRACTICE]
+    scored = [
+        (sim, node)
+        for node in practices
+        if (sim := _practice_similarity(template, node)) >= min_similarity
+    ]
+    scored.sort(key=lambda t: t[0], reverse=True)
+    return [practice for _, practice in scored]
 
 
 def match_pattern(
@@ -36,15 +36,10 @@ def match_pattern(
     **kwargs
 ) -> list:
     """Match a named pattern against the graph."""
-    patterns = {
-        "morning_routine": _match_morning_routine,
-        "avoidance": _match_avoidance,
-        "exploration": _match_exploration,
-    }
-    
-    if pattern_type in patterns:
-        return patterns[pattern_type](graph, **kwargs)
-    
+    matcher = _PATTERNS.get(pattern_type)
+    if matcher is not None:
+        return matcher(graph, **kwargs)
+
     return []
 
 
@@ -70,27 +65,31 @@ def _practice_similarity(p1: Practice, p2: Practice) -> float:
 
 def _match_morning_routine(graph: PlatialGraph, **kwargs) -> list[Practice]:
     """Find morning routines."""
-    routines = []
-    for node in graph.nodes(NodeType.PRACTICE):
-        if isinstance(node, Practice):
-            if node.is_routine and "morning" in node.typical_time.lower():
-                routines.append(node)
-    return routines
+    return [
+        node for node in graph.snapshot_by_type(NodeType.PRACTICE)[NodeType.PRACTICE]
+        if node.is_routine and "morning" in node.typical_time.lower()
+    ]
 
 
 def _match_avoidance(graph: PlatialGraph, **kwargs) -> list[Practice]:
     """Find avoidance patterns."""
-    from chora.core.types import PracticeType
     return [
-        node for node in graph.nodes(NodeType.PRACTICE)
-        if isinstance(node, Practice) and node.practice_type == PracticeType.AVOIDANCE
+        node for node in graph.snapshot_by_type(NodeType.PRACTICE)[NodeType.PRACTICE]
+        if node.practice_type == PracticeType.AVOIDANCE
     ]
 
 
 def _match_exploration(graph: PlatialGraph, **kwargs) -> list[Practice]:
     """Find exploration patterns."""
-    from chora.core.types import PracticeType
     return [
-        node for node in graph.nodes(NodeType.PRACTICE)
-        if isinstance(node, Practice) and node.practice_type == PracticeType.EXPLORATION
+        node for node in graph.snapshot_by_type(NodeType.PRACTICE)[NodeType.PRACTICE]
+        if node.practice_type == PracticeType.EXPLORATION
     ]
+
+
+# Static dispatch table, built once at import instead of per call
+_PATTERNS = {
+    "morning_routine": _match_morning_routine,
+    "avoidance": _match_avoidance,
+    "exploration": _match_exploration,
+}
@@ -43,6 +43,8 @@ class PlatialQuery:
     at_time: datetime | None = None
     extent_ids: set[str] | None = None
     filters: list[Callable[[PlatialNode], bool]] = field(default_factory=list)
+    cheap_filters: list[Callable[[PlatialNode], bool]] = field(default_factory=list)
+    limit_count: int | None = None
     
     def for_agent(self, agent_id: str | AgentId) -> PlatialQuery:
         """Filter to a specific agent."""
@@ -76,45 +78,75 @@ class PlatialQuery:
         self.extent_ids = set(extent_ids)
         return self
     
-    def add_filter(self, predicate: Callable[[PlatialNode], bool]) -> PlatialQuery:
-        """Add custom filter."""
-        self.filters.append(predicate)
+    def add_filter(self, predicate: Callable[[PlatialNode], bool],
+                   cheap: bool = False) -> PlatialQuery:
+        """
+        Add custom filter on the extent node.
+
+        Mark a predicate `cheap=True` when it only inspects the extent
+        itself; cheap filters run before place extraction and can reject
+        an extent without paying for the subgraph build.
+        """
+        if cheap:
+            self.cheap_filters.append(predicate)
+        else:
+            self.filters.append(predicate)
         return self
-    
-    def execute(self) -> list[EmergentPlace]:
-        """Execute query and return matching places."""
-        places = []
-        
+
+    def limit(self, n: int) -> PlatialQuery:
+        """Stop after the first n matching places."""
+        self.limit_count = n
+        return self
+
+    def execute(self) -> Iterator[EmergentPlace]:
+        """
+        Execute query, yielding matching places lazily.
+
+        Callers that need a list can wrap with `list(...)`; combined
+        with :meth:`limit`, extraction stops as soon as enough places
+        match instead of scanning every extent.
+        """
+        yielded = 0
+
         for node in self.graph.nodes(NodeType.SPATIAL_EXTENT):
+            # Push the cheap predicates ahead of extract_place, which
+            # dominates per-extent cost
             if self.extent_ids and str(node.id) not in self.extent_ids:
                 continue
-            
+
+            if not all(pred(node) for pred in self.cheap_filters):
+                continue
+
             place = extract_place(
                 self.graph,
                 ExtentId(str(node.id)),
                 self.agent_id
             )
-            
-            # Apply filters
+
+            # Apply filters that need the extracted place
             if self.min_familiarity is not None:
                 if place.familiarity_score < self.min_familiarity:
                     continue
-            
+
             if self.max_familiarity is not None:
                 if place.familiarity_score > self.max_familiarity:
                     continue
-            
+
             if self.min_affect_valence is not None:
                 if place.affect_valence_mean < self.min_affect_valence:
                     continue
-            
+
             if self.max_affect_valence is not None:
                 if place.affect_valence_mean > self.max_affect_valence:
                     continue
-            
-            places.append(place)
-        
-        return places
+
+            if not all(pred(node) for pred in self.filters):
+                continue
+
+            yield place
+            yielded += 1
+            if self.limit_count is not None and yielded >= self.limit_count:
+                return
 
 
 def find_familiar_places(
@@ -123,10 +155,10 @@ def find_familiar_places(
     min_familiarity: float = 0.5
 ) -> list[EmergentPlace]:
     """Find places where agent has high familiarity."""
-    return (PlatialQuery(graph)
-            .for_agent(agent_id)
-            .with_familiarity(min_value=min_familiarity)
-            .execute())
+    return list(PlatialQuery(graph)
+                .for_agent(agent_id)
+                .with_familiarity(min_value=min_familiarity)
+                .execute())
 
 
 def find_positive_places(
@@ -134,10 +166,10 @@ def find_positive_places(
     agent_id: AgentId
 ) -> list[EmergentPlace]:
     """Find places with positive affect for agent."""
-    return (PlatialQuery(graph)
-            .for_agent(agent_id)
-            .with_positive_affect()
-            .execute())
+    return list(PlatialQuery(graph)
+                .for_agent(agent_id)
+                .with_positive_affect()
+                .execute())
 
 
 def find_routine_places(
@@ -149,6 +181,7 @@ def find_routine_places(
     places = (PlatialQuery(graph)
               .for_agent(agent_id)
               .execute())
+    # Filter over the lazy stream without materializing it first
     return [p for p in places if p.encounter_count >= min_encounters]
 
 
@@ -159,21 +192,16 @@ def query_encounters(
     start_time: datetime | None = None,
     end_time: datetime | None = None
 ) -> Iterator[Encounter]:
-    """Query encounters with filters."""
-    for node in graph.nodes(NodeType.ENCOUNTER):
-        if not isinstance(node, Encounter):
-            continue
-        
-        if agent_id and node.agent_id != agent_id:
-            continue
-        
-        if extent_id and node.extent_id != extent_id:
-            continue
-        
-        if start_time and node.start_time < start_time:
-            continue
-        
-        if end_time and node.end_time and node.end_time > end_time:
-            continue
-        
-        yield node
+    """
+    Query encounters with filters.
+
+    Delegates to :meth:`PlatialGraph.encounters`, which cuts the
+    candidate set with the graph's inverted indexes before applying the
+    time bounds, instead of filtering every encounter node in Python.
+    """
+    yield from graph.encounters(
+        agent_id=agent_id or None,
+        extent_id=extent_id or None,
+        start_time=start_time,
+        end_time=end_time,
+    )
@@ -4,57 +4,181 @@ Platial Similarity Measures
 
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
+from typing import Sequence
+
+import numpy as np
+
 from chora.derive.place import EmergentPlace
 from chora.core.practice import Practice
 
+# Pairwise similarity memo for repeat scoring of the same objects
+# (sorting, clustering). Keys are canonicalized id() pairs, so entries
+# are only meaningful while both objects stay alive — call
+# clear_similarity_cache() between sessions.
+_PAIR_CACHE_SIZE = 100_000
+_pair_cache: OrderedDict[tuple[int, int, str], float] = OrderedDict()
+
+
+def _pair_cached(kind: str, p1: object, p2: object) -> tuple | None:
+    a, b = id(p1), id(p2)
+    key = (a, b, kind) if a <= b else (b, a, kind)
+    value = _pair_cache.get(key)
+    if value is not None:
+        _pair_cache.move_to_end(key)
+    return key, value
+
+
+def _pair_store(key: tuple, value: float) -> None:
+    _pair_cache[key] = value
+    if len(_pair_cache) > _PAIR_CACHE_SIZE:
+        _pair_cache.popitem(last=False)
+
+
+def clear_similarity_cache() -> None:
+    """Drop memoized pair scores (e.g. between query sessions)."""
+    _pair_cache.clear()
+
 
 def place_similarity(p1: EmergentPlace, p2: EmergentPlace) -> float:
     """
     Compute similarity between two emergent places.
-    
-    Considers familiarity, affect, and encounter patterns.
+
+    Considers familiarity, affect, and encounter patterns. Symmetric
+    pairs are memoized for the lifetime of the objects.
+    """
+    key, cached = _pair_cached("place", p1, p2)
+    if cached is not None:
+        return cached
+
+    score = _place_sim_kernel(
+        p1.familiarity_score, p1.affect_valence_mean,
+        p1.encounter_count, p1.meaning_count,
+        p2.familiarity_score, p2.affect_valence_mean,
+        p2.encounter_count, p2.meaning_count,
+    )
+    _pair_store(key, score)
+    return score
+
+
+def _place_sim_kernel(
+    fam1: float, aff1: float, enc1: int, mean1: int,
+    fam2: float, aff2: float, enc2: int, mean2: int,
+) -> float:
+    """
+    Scalar similarity kernel over unpacked place fields.
+
+    Callers scoring many candidates should unpack attributes once and
+    loop over this kernel (or use :func:`place_similarity_batch`) so the
+    inner loop is pure arithmetic with no attribute dispatch.
     """
     score = 0.0
-    
+
     # Familiarity similarity
-    fam_diff = abs(p1.familiarity_score - p2.familiarity_score)
-    score += 0.3 * (1 - fam_diff)
-    
+    score += 0.3 * (1 - abs(fam1 - fam2))
+
     # Affect similarity
-    affect_diff = abs(p1.affect_valence_mean - p2.affect_valence_mean) / 2
-    score += 0.3 * (1 - affect_diff)
-    
+    score += 0.3 * (1 - abs(aff1 - aff2) / 2)
+
     # Encounter count similarity (log scale)
-    import math
-    if p1.encounter_count > 0 and p2.encounter_count > 0:
-        log_ratio = abs(math.log(p1.encounter_count) - math.log(p2.encounter_count))
+    if enc1 > 0 and enc2 > 0:
+        log_ratio = abs(math.log(enc1) - math.log(enc2))
         score += 0.2 * max(0, 1 - log_ratio / 3)
-    
+
     # Meaning count similarity
-    max_meaning = max(p1.meaning_count, p2.meaning_count, 1)
-    meaning_diff = abs(p1.meaning_count - p2.meaning_count) / max_meaning
-    score += 0.2 * (1 - meaning_diff)
-    
+    max_meaning = max(mean1, mean2, 1)
+    score += 0.2 * (1 - abs(mean1 - mean2) / max_meaning)
+
     return score
 
 
+def place_similarity_batch(
+    place: EmergentPlace,
+    others: Sequence[EmergentPlace]
+) -> np.ndarray:
+    """
+    Score one place against many in vectorized form.
+
+    Returns a float64 array aligned with `others`.
+    """
+    n = len(others)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+
+    fams = np.fromiter(
+        (p.familiarity_score for p in others), dtype=np.float64, count=n
+    )
+    affs = np.fromiter(
+        (p.affect_valence_mean for p in others), dtype=np.float64, count=n
+    )
+    encs = np.fromiter(
+        (p.encounter_count for p in others), dtype=np.float64, count=n
+    )
+    means = np.fromiter(
+        (p.meaning_count for p in others), dtype=np.float64, count=n
+    )
+
+    scores = 0.3 * (1 - np.abs(fams - place.familiarity_score))
+    scores += 0.3 * (1 - np.abs(affs - place.affect_valence_mean) / 2)
+
+    if place.encounter_count > 0:
+        positive = encs > 0
+        log_ratio = np.abs(
+            np.log(encs, where=positive, out=np.zeros(n))
+            - math.log(place.encounter_count)
+        )
+        scores += np.where(
+            positive, 0.2 * np.maximum(0.0, 1 - log_ratio / 3), 0.0
+        )
+
+    max_meaning = np.maximum(np.maximum(means, place.meaning_count), 1)
+    scores += 0.2 * (1 - np.abs(means - place.meaning_count) / max_meaning)
+
+    return scores
+
+
+def rank_similar_places(
+    place: EmergentPlace,
+    candidates: Sequence[EmergentPlace],
+    top_k: int | None = None
+) -> list[tuple[EmergentPlace, float]]:
+    """
+    Rank candidates by similarity to a reference place.
+
+    Gathers candidate scalars into arrays once and scores them with the
+    vectorized batch kernel, then argsorts the result — one native loop
+    instead of N Python similarity calls inside a sort key.
+    """
+    scores = place_similarity_batch(place, candidates)
+    order = np.argsort(-scores, kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
+    return [(candidates[i], float(scores[i])) for i in order]
+
+
 def practice_similarity(p1: Practice, p2: Practice) -> float:
     """
     Compute similarity between two practices.
     """
+    key, cached = _pair_cached("practice", p1, p2)
+    if cached is not None:
+        return cached
+
     score = 0.0
-    
+
     # Type match
     if p1.practice_type == p2.practice_type:
         score += 0.4
-    
+
     # Regularity similarity
     reg_diff = abs(p1.regularity - p2.regularity)
     score += 0.3 * (1 - reg_diff)
-    
+
     # Frequency similarity
     if p1.frequency > 0 and p2.frequency > 0:
         freq_ratio = min(p1.frequency, p2.frequency) / max(p1.frequency, p2.frequency)
         score += 0.3 * freq_ratio
-    
+
+    _pair_store(key, score)
     return score
@@ -35,8 +35,14 @@ def temporal_range_query(
     
     Yields nodes whose validity overlaps with [start, end].
     """
+    # Prefer the graph's sorted temporal index; fall back to a linear
+    # scan for graph-like adapters that don't provide it
+    if hasattr(graph, "nodes_in_interval"):
+        yield from graph.nodes_in_interval(start, end)
+        return
+
     query_interval = TimeInterval(start=start, end=end)
-    
+
     for node in graph.nodes():
         if node.temporal.interval.overlaps(query_interval):
             yield node
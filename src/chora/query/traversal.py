@@ -7,6 +7,8 @@ from __future__ import annotations
 from collections import deque
 from typing import Iterator, Callable
 
+import numpy as np
+
 from chora.core.types import NodeId, EdgeType
 from chora.core.graph import PlatialGraph
 from chora.core.node import PlatialNode
@@ -21,33 +23,74 @@ def traverse_from(
 ) -> Iterator[tuple[PlatialNode, int]]:
     """
     Breadth-first traversal from a starting node.
-    
+
     Yields (node, depth) tuples.
     """
+    if not edge_types and hasattr(graph, "adjacency_csr"):
+        yield from _traverse_csr(graph, start_id, max_depth)
+        return
+
+    # Hand the type filter to the graph so each expansion skips the
+    # per-edge membership test at this level
+    type_filter = frozenset(edge_types) if edge_types else None
+
     visited: set[NodeId] = {start_id}
     queue: deque[tuple[NodeId, int]] = deque([(start_id, 0)])
-    
+
     while queue:
         current_id, depth = queue.popleft()
-        
+
         try:
             node = graph.get_node(current_id)
             yield node, depth
         except Exception:
             continue
-        
+
         if depth >= max_depth:
             continue
-        
-        for edge in graph.outgoing_edges(current_id, None):
-            if edge_types and edge.edge_type not in edge_types:
-                continue
-            
-            if edge.target_id not in visited:
-                visited.add(edge.target_id)
+
+        for edge in graph.outgoing_edges(current_id, type_filter):
+            # Single hash per edge: add unconditionally and detect
+            # newness from the size change
+            before = len(visited)
+            visited.add(edge.target_id)
+            if len(visited) != before:
                 queue.append((edge.target_id, depth + 1))
 
 
+def _traverse_csr(
+    graph: PlatialGraph,
+    start_id: NodeId,
+    max_depth: int
+) -> Iterator[tuple[PlatialNode, int]]:
+    """
+    BFS over the graph's CSR adjacency.
+
+    The queue holds int32 row ids, and visited is a boolean bitmap
+    indexed by row — no per-hop hashing and no scattered dict walks.
+    """
+    row_of, node_ids, indptr, indices, _, _ = graph.adjacency_csr()
+    start_row = row_of.get(start_id)
+    if start_row is None:
+        return
+
+    visited = np.zeros(len(node_ids), dtype=bool)
+    visited[start_row] = True
+    queue: deque[tuple[int, int]] = deque([(start_row, 0)])
+
+    while queue:
+        row, depth = queue.popleft()
+        yield graph.get_node(node_ids[row]), depth
+
+        if depth >= max_depth:
+            continue
+
+        for target in indices[indptr[row]:indptr[row + 1]]:
+            if not visited[target]:
+                visited[target] = True
+                queue.append((int(target), depth + 1))
+
+
 def find_connected(
     graph: PlatialGraph,
     node_id: NodeId,
@@ -75,22 +118,129 @@ def find_path(
     """
     if start_id == end_id:
         return [start_id]
-    
-    visited: set[NodeId] = {start_id}
-    queue: deque[tuple[NodeId, list[NodeId]]] = deque([(start_id, [start_id])])
-    
-    while queue:
-        current_id, path = queue.popleft()
-        
-        for edge in graph.outgoing_edges(current_id, None):
-            if edge_types and edge.edge_type not in edge_types:
-                continue
-            
-            if edge.target_id == end_id:
-                return path + [end_id]
-            
-            if edge.target_id not in visited:
-                visited.add(edge.target_id)
-                queue.append((edge.target_id, path + [edge.target_id]))
-    
+
+    if not edge_types and hasattr(graph, "adjacency_csr"):
+        return _find_path_csr(graph, start_id, end_id)
+
+    # Bidirectional BFS: grow a forward frontier over outgoing edges and
+    # a backward frontier over incoming edges, always expanding the
+    # smaller one. Explores ~2·b^(d/2) nodes instead of b^d. Parent
+    # pointers keep each enqueue O(1); the path is stitched once at the
+    # meeting node.
+    type_filter = frozenset(edge_types) if edge_types else None
+
+    fwd_parents: dict[NodeId, NodeId | None] = {start_id: None}
+    bwd_parents: dict[NodeId, NodeId | None] = {end_id: None}
+    fwd_frontier: list[NodeId] = [start_id]
+    bwd_frontier: list[NodeId] = [end_id]
+
+    def _stitch(meet: NodeId) -> list[NodeId]:
+        path = []
+        node: NodeId | None = meet
+        while node is not None:
+            path.append(node)
+            node = fwd_parents[node]
+        path.reverse()
+        node = bwd_parents[meet]
+        while node is not None:
+            path.append(node)
+            node = bwd_parents[node]
+        return path
+
+    while fwd_frontier and bwd_frontier:
+        if len(fwd_frontier) <= len(bwd_frontier):
+            next_frontier = []
+            for current_id in fwd_frontier:
+                for edge in graph.outgoing_edges(current_id, type_filter):
+                    target_id = edge.target_id
+                    # setdefault folds the membership test and insert
+                    # into one hash lookup
+                    if fwd_parents.setdefault(target_id, current_id) is not current_id:
+                        continue
+                    if target_id in bwd_parents:
+                        return _stitch(target_id)
+                    next_frontier.append(target_id)
+            fwd_frontier = next_frontier
+        else:
+            next_frontier = []
+            for current_id in bwd_frontier:
+                for edge in graph.incoming_edges(current_id, type_filter):
+                    source_id = edge.source_id
+                    if bwd_parents.setdefault(source_id, current_id) is not current_id:
+                        continue
+                    if source_id in fwd_parents:
+                        return _stitch(source_id)
+                    next_frontier.append(source_id)
+            bwd_frontier = next_frontier
+
+    return None
+
+
+def _find_path_csr(
+    graph: PlatialGraph,
+    start_id: NodeId,
+    end_id: NodeId
+) -> list[NodeId] | None:
+    """
+    Bidirectional BFS over the graph's CSR adjacency.
+
+    Same search strategy as the filtered path, but frontiers hold int32
+    rows and parents live in two flat int32 arrays (-1 = unseen, root
+    points at itself), replacing per-node dict hashing with array
+    indexing.
+    """
+    row_of, node_ids, out_indptr, out_indices, in_indptr, in_indices = (
+        graph.adjacency_csr()
+    )
+    start = row_of.get(start_id)
+    end = row_of.get(end_id)
+    if start is None or end is None:
+        return None
+
+    n = len(node_ids)
+    fwd_parent = np.full(n, -1, dtype=np.int32)
+    bwd_parent = np.full(n, -1, dtype=np.int32)
+    fwd_parent[start] = start
+    bwd_parent[end] = end
+    fwd_frontier: list[int] = [start]
+    bwd_frontier: list[int] = [end]
+
+    def _stitch(meet: int) -> list[NodeId]:
+        path = []
+        row = meet
+        while row != start:
+            path.append(node_ids[row])
+            row = int(fwd_parent[row])
+        path.append(node_ids[start])
+        path.reverse()
+        row = meet
+        while row != end:
+            row = int(bwd_parent[row])
+            path.append(node_ids[row])
+        return path
+
+    while fwd_frontier and bwd_frontier:
+        if len(fwd_frontier) <= len(bwd_frontier):
+            next_frontier: list[int] = []
+            for row in fwd_frontier:
+                for target in out_indices[out_indptr[row]:out_indptr[row + 1]]:
+                    target = int(target)
+                    if fwd_parent[target] == -1:
+                        fwd_parent[target] = row
+                        if bwd_parent[target] != -1:
+                            return _stitch(target)
+                        next_frontier.append(target)
+            fwd_frontier = next_frontier
+        else:
+            next_frontier = []
+            for row in bwd_frontier:
+                for source in in_indices[in_indptr[row]:in_indptr[row + 1]]:
+                    source = int(source)
+                    if bwd_parent[source] == -1:
+                        bwd_parent[source] = row
+                        if fwd_parent[source] != -1:
+                            return _stitch(source)
+                        next_frontier.append(source)
+            bwd_frontier = next_frontier
+
     return None
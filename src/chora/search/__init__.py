@@ -6,6 +6,8 @@ other places, or abstract qualities.
 """
 from __future__ import annotations
 
+import base64
+import functools
 import json
 from dataclasses import dataclass, field
 from typing import Iterator, Any, Callable
@@ -34,29 +36,44 @@ class PlaceEmbedding:
     source: str = "combined"  # text, affect, encounters, combined
     model: str = "all-MiniLM-L6-v2"
     metadata: dict[str, Any] = field(default_factory=dict)
-    
+
+    def __post_init__(self):
+        # float32 halves memory and keeps search on the fast BLAS path;
+        # encoder output is float32 anyway, so nothing is lost
+        self.embedding = np.asarray(self.embedding, dtype=np.float32)
+
     @property
     def dimension(self) -> int:
         return len(self.embedding)
-    
+
     def similarity(self, other: PlaceEmbedding) -> float:
         """Compute cosine similarity with another embedding."""
         return cosine_similarity(self.embedding, other.embedding)
-    
+
     def to_dict(self) -> dict:
         return {
             "extent_id": str(self.extent_id),
-            "embedding": self.embedding.tolist(),
+            # base64 of the raw float32 buffer is ~5x smaller in JSON
+            # than a list of Python floats
+            "embedding": base64.b64encode(self.embedding.tobytes()).decode("ascii"),
             "source": self.source,
             "model": self.model,
             "metadata": self.metadata
         }
-    
+
     @classmethod
     def from_dict(cls, data: dict) -> PlaceEmbedding:
+        raw = data["embedding"]
+        if isinstance(raw, str):
+            embedding = np.frombuffer(
+                base64.b64decode(raw), dtype=np.float32
+            ).copy()
+        else:
+            # Older indexes stored plain float lists
+            embedding = np.asarray(raw, dtype=np.float32)
         return cls(
             extent_id=NodeId(data["extent_id"]),
-            embedding=np.array(data["embedding"]),
+            embedding=embedding,
             source=data.get("source", "combined"),
             model=data.get("model", "unknown"),
             metadata=data.get("metadata", {})
@@ -74,39 +91,71 @@ class PlaceIndex:
     embeddings: dict[str, PlaceEmbedding] = field(default_factory=dict)
     model_name: str = "all-MiniLM-L6-v2"
     _embedder: Any = None
-    
+    # Contiguous pre-normalized rows for one-GEMV search; rebuilt
+    # lazily after add/remove invalidates them
+    _matrix: np.ndarray | None = field(default=None, repr=False)
+    _ids: list[str] = field(default_factory=list, repr=False)
+
     def add(self, embedding: PlaceEmbedding) -> None:
         """Add an embedding to the index."""
         self.embeddings[str(embedding.extent_id)] = embedding
-    
+        self._matrix = None
+
     def remove(self, extent_id: NodeId) -> None:
         """Remove an embedding from the index."""
         self.embeddings.pop(str(extent_id), None)
-    
+        self._matrix = None
+
     def get(self, extent_id: NodeId) -> PlaceEmbedding | None:
         """Get embedding for a specific extent."""
         return self.embeddings.get(str(extent_id))
-    
+
+    def _rebuild_matrix(self) -> None:
+        """Stack embeddings into unit-norm float32 rows."""
+        self._ids = list(self.embeddings)
+        matrix = np.stack(
+            [np.asarray(self.embeddings[eid].embedding, dtype=np.float32)
+             for eid in self._ids]
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero rows and score 0 against any query
+        np.divide(matrix, norms, out=matrix, where=norms != 0)
+        self._matrix = matrix
+
     def search(
-        self, 
-        query_embedding: np.ndarray, 
+        self,
+        query_embedding: np.ndarray,
         top_k: int = 10,
         min_similarity: float = 0.0
     ) -> list[tuple[str, float]]:
         """
         Search for most similar places.
-        
+
         Returns list of (extent_id, similarity) tuples.
         """
-        results = []
-        
-        for extent_id, emb in self.embeddings.items():
-            sim = cosine_similarity(query_embedding, emb.embedding)
-            if sim >= min_similarity:
-                results.append((extent_id, sim))
-        
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        if not self.embeddings:
+            return []
+        if self._matrix is None:
+            self._rebuild_matrix()
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        query = query / query_norm
+
+        # All cosine similarities in one GEMV over pre-normalized rows
+        sims = self._matrix @ query
+
+        candidates = np.flatnonzero(sims >= min_similarity)
+        if candidates.size > top_k:
+            # Partial selection of the top k (O(N + k log k), the array
+            # analogue of heapq.nlargest), then sort just those
+            keep = np.argpartition(-sims[candidates], top_k - 1)[:top_k]
+            candidates = candidates[keep]
+        order = candidates[np.argsort(-sims[candidates], kind="stable")]
+
+        return [(self._ids[i], float(sims[i])) for i in order]
     
     def search_by_text(
         self, 
@@ -139,22 +188,64 @@ class PlaceIndex:
         return results[:top_k]
     
     def save(self, path: str | Path) -> None:
-        """Save index to file."""
+        """
+        Save index to file.
+
+        Metadata goes to `path` as JSON; the embedding rows go to a
+        binary `.npz` sidecar next to it, so loading is a memcpy rather
+        than per-float JSON parsing.
+        """
+        path = Path(path)
+        ids = list(self.embeddings)
         data = {
             "model_name": self.model_name,
-            "embeddings": {
-                k: v.to_dict() for k, v in self.embeddings.items()
-            }
+            "ids": ids,
+            "entries": {
+                eid: {
+                    "source": self.embeddings[eid].source,
+                    "model": self.embeddings[eid].model,
+                    "metadata": self.embeddings[eid].metadata,
+                }
+                for eid in ids
+            },
         }
-        Path(path).write_text(json.dumps(data))
-    
+        path.write_text(json.dumps(data))
+        if ids:
+            matrix = np.stack(
+                [self.embeddings[eid].embedding for eid in ids]
+            ).astype(np.float32)
+            np.savez(self._sidecar_path(path), embeddings=matrix)
+
+    @staticmethod
+    def _sidecar_path(path: Path) -> Path:
+        return path.with_name(path.name + ".npz")
+
     @classmethod
     def load(cls, path: str | Path) -> PlaceIndex:
         """Load index from file."""
-        data = json.loads(Path(path).read_text())
+        path = Path(path)
+        data = json.loads(path.read_text())
         index = cls(model_name=data.get("model_name", "unknown"))
-        for k, v in data.get("embeddings", {}).items():
-            index.embeddings[k] = PlaceEmbedding.from_dict(v)
+
+        if "ids" in data:
+            ids = data["ids"]
+            entries = data.get("entries", {})
+            if ids:
+                with np.load(cls._sidecar_path(path)) as npz:
+                    matrix = npz["embeddings"]
+                for eid, row in zip(ids, matrix):
+                    entry = entries.get(eid, {})
+                    index.embeddings[eid] = PlaceEmbedding(
+                        extent_id=NodeId(eid),
+                        embedding=row,
+                        source=entry.get("source", "combined"),
+                        model=entry.get("model", "unknown"),
+                        metadata=entry.get("metadata", {}),
+                    )
+        else:
+            # Older single-file format with embeddings inline
+            for k, v in data.get("embeddings", {}).items():
+                index.embeddings[k] = PlaceEmbedding.from_dict(v)
         return index
 
 
@@ -162,8 +253,15 @@ class PlaceIndex:
 # Embedding Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=4)
 def get_embedder(model_name: str = "all-MiniLM-L6-v2"):
-    """Get or create a sentence transformer model."""
+    """
+    Get or create a sentence transformer model.
+
+    Cached per model name — loading a SentenceTransformer costs seconds
+    of I/O and hundreds of MB, so repeat embed/search calls must not
+    reconstruct it.
+    """
     try:
         from sentence_transformers import SentenceTransformer
         return SentenceTransformer(model_name)
@@ -180,55 +278,76 @@ def embed_text(text: str, model_name: str = "all-MiniLM-L6-v2") -> np.ndarray:
     return embedder.encode(text)
 
 
-def embed_extent(
+def _encounter_stats(graph: PlatialGraph) -> dict[str, tuple[int, set[str]]]:
+    """One pass over encounters: extent id -> (count, activities)."""
+    stats: dict[str, tuple[int, set[str]]] = {}
+    for node in graph.nodes(NodeType.ENCOUNTER):
+        extent_id = getattr(node, 'extent_id', None)
+        if extent_id is None:
+            continue
+        count, activities = stats.setdefault(str(extent_id), (0, set()))
+        if hasattr(node, 'activity'):
+            activities.add(node.activity)
+        stats[str(extent_id)] = (count + 1, activities)
+    return stats
+
+
+def _extent_to_text(
     extent: SpatialExtent,
     graph: PlatialGraph | None = None,
     include_encounters: bool = True,
-    model_name: str = "all-MiniLM-L6-v2"
-) -> PlaceEmbedding:
-    """
-    Create an embedding for a spatial extent.
-    
-    Combines multiple signals:
-    - Name and semantic hints as text
-    - Encounter descriptions (if graph provided)
-    - Affect qualities (if available)
-    """
-    # Build text description
+    encounter_stats: dict[str, tuple[int, set[str]]] | None = None
+) -> str:
+    """Assemble the text description an extent is embedded from."""
     parts = []
-    
+
     if extent.name:
         parts.append(extent.name)
-    
+
     if extent.semantic_hints:
         for key, value in extent.semantic_hints.items():
             parts.append(f"{key}: {value}")
-    
+
     if extent.extent_type:
         parts.append(f"type: {extent.extent_type}")
-    
-    # If we have a graph, add encounter info
+
+    # If we have a graph, add encounter info; a precomputed stats map
+    # replaces the per-extent scan over every encounter node
     if graph and include_encounters:
-        encounter_count = 0
-        activities = set()
-        
-        for node in graph.nodes(NodeType.ENCOUNTER):
-            if hasattr(node, 'extent_id') and str(node.extent_id) == str(extent.id):
-                encounter_count += 1
-                if hasattr(node, 'activity'):
-                    activities.add(node.activity)
-        
+        if encounter_stats is None:
+            encounter_stats = _encounter_stats(graph)
+        encounter_count, activities = encounter_stats.get(
+            str(extent.id), (0, set())
+        )
+
         if encounter_count > 0:
             parts.append(f"visited {encounter_count} times")
-        
+
         if activities:
             parts.append(f"activities: {', '.join(activities)}")
-    
-    text = ". ".join(parts) if parts else "unknown place"
-    
+
+    return ". ".join(parts) if parts else "unknown place"
+
+
+def embed_extent(
+    extent: SpatialExtent,
+    graph: PlatialGraph | None = None,
+    include_encounters: bool = True,
+    model_name: str = "all-MiniLM-L6-v2"
+) -> PlaceEmbedding:
+    """
+    Create an embedding for a spatial extent.
+
+    Combines multiple signals:
+    - Name and semantic hints as text
+    - Encounter descriptions (if graph provided)
+    - Affect qualities (if available)
+    """
+    text = _extent_to_text(extent, graph, include_encounters)
+
     embedder = get_embedder(model_name)
     embedding = embedder.encode(text)
-    
+
     return PlaceEmbedding(
         extent_id=extent.id,
         embedding=embedding,
@@ -244,11 +363,30 @@ def build_place_index(
 ) -> PlaceIndex:
     """Build a complete place index from a graph."""
     index = PlaceIndex(model_name=model_name)
-    
-    for extent in graph.nodes(NodeType.SPATIAL_EXTENT):
-        emb = embed_extent(extent, graph, model_name=model_name)
-        index.add(emb)
-    
+
+    # Assemble every description first, then embed them in one batched
+    # encode call — per-extent single-string encodes starve the model
+    extents = list(graph.nodes(NodeType.SPATIAL_EXTENT))
+    if not extents:
+        return index
+
+    stats = _encounter_stats(graph)
+    texts = [
+        _extent_to_text(extent, graph, encounter_stats=stats)
+        for extent in extents
+    ]
+    embedder = get_embedder(model_name)
+    matrix = embedder.encode(texts, batch_size=64, convert_to_numpy=True)
+
+    for extent, text, embedding in zip(extents, texts, matrix):
+        index.add(PlaceEmbedding(
+            extent_id=extent.id,
+            embedding=embedding,
+            source="combined",
+            model=model_name,
+            metadata={"text": text}
+        ))
+
     return index
 
 
@@ -321,14 +459,22 @@ def find_similar_places(
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two vectors."""
-    dot = np.dot(a, b)
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
-    
-    if norm_a == 0 or norm_b == 0:
+    # Fused dot-product reductions: no intermediate norm arrays and a
+    # single sqrt over the combined denominator
+    denom_sq = np.dot(a, a) * np.dot(b, b)
+    if denom_sq == 0:
         return 0.0
-    
-    return float(dot / (norm_a * norm_b))
+    return float(np.dot(a, b) / np.sqrt(denom_sq))
+
+
+def cosine_similarity_normed(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Cosine similarity for vectors already unit-normalized.
+
+    Skips the norm computation entirely — use for embeddings produced
+    with `normalize_embeddings=True` or rows of `PlaceIndex._matrix`.
+    """
+    return float(np.dot(a, b))
 
 
 def batch_embed(
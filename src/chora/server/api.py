@@ -2,6 +2,7 @@
 API Routes for Chora Server.
 """
 from typing import List, Optional
+import numpy as np
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -105,7 +106,8 @@ async def create_embedding(text: str):
     """
     from chora.embeddings import get_embedding_model
     model = get_embedding_model()
-    return model.embed_text(text)
+    # embed_text returns a float32 ndarray; serialize to plain floats
+    return np.asarray(model.embed_text(text), dtype=float).tolist()
 
 @router.get("/places/{agent_id}/{extent_id}", response_model=PlaceResponse)
 async def get_emergent_place(agent_id: str, extent_id: str):
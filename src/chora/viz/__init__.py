@@ -3,14 +3,25 @@ Chora Visualization Module
 
 Exports platial graphs to various visualization formats.
 """
-from chora.viz.d3_export import export_d3_json, export_force_graph
-from chora.viz.timeline import export_timeline_html, export_timeline_data
-from chora.viz.html_report import generate_report
+from chora.viz.d3_export import (
+    export_d3_json,
+    export_force_graph,
+    export_force_graph_async,
+)
+from chora.viz.timeline import (
+    export_timeline_html,
+    export_timeline_html_async,
+    export_timeline_data,
+)
+from chora.viz.html_report import generate_report, generate_report_async
 
 __all__ = [
     "export_d3_json",
     "export_force_graph",
+    "export_force_graph_async",
     "export_timeline_html",
+    "export_timeline_html_async",
     "export_timeline_data",
     "generate_report",
+    "generate_report_async",
 ]
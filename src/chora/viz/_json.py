@@ -0,0 +1,30 @@
+"""
+JSON serialization helper for viz exports.
+
+Uses orjson when available — serializing large graph payloads into HTML
+is CPU-bound, and orjson is several times faster than the stdlib — and
+falls back to ``json`` otherwise, so orjson stays an optional speedup
+rather than a dependency.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize to compact JSON, stringifying unknown types.
+
+    The payloads are embedded in <script> blocks nobody reads, so no
+    indentation: the minified form is several times smaller and both
+    serializes and parses faster.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str)
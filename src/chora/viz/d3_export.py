@@ -5,41 +5,74 @@ Export platial graphs to D3.js-compatible JSON format.
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import html
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import networkx as nx
+
 from chora.core import PlatialGraph
 from chora.core.types import NodeType
+from chora.viz._json import dumps as _dumps
+
+# Shared result for the empty graph (read-only so callers cannot
+# mutate it), with its serialization materialized once at import
+_EMPTY_D3 = MappingProxyType({"nodes": (), "links": ()})
+_EMPTY_D3_JSON = _dumps({"nodes": [], "links": []})
+
+# Serialized payloads keyed by (graph identity, version): repeated
+# exports of an unchanged graph (dashboard refreshes) reuse the JSON
+# instead of re-collecting and re-serializing
+_PAYLOAD_CACHE_SIZE = 8
+_payload_cache: OrderedDict[tuple[int, int], str] = OrderedDict()
+
+# Node types whose dataclasses carry a `name` field; checked by type
+# tag so the hot export loop does direct field access instead of a
+# getattr-with-default per node
+_NAMED_TYPES = frozenset({
+    NodeType.AGENT, NodeType.SPATIAL_EXTENT, NodeType.PRACTICE
+})
+
+# Sentinel for single-lookup optional attribute probes
+_MISSING = object()
 
 
 def export_d3_json(graph: PlatialGraph) -> dict:
     """
     Export graph to D3.js force-directed graph format.
-    
+
     Returns a dict with 'nodes' and 'links' arrays.
     """
+    if graph.node_count == 0 and graph.edge_count == 0:
+        return _EMPTY_D3
+
     nodes = []
     links = []
     node_ids = set()
     
     # Collect all nodes
     for node in graph.nodes():
+        nid = str(node.id)
+        node_type = node.node_type
         node_data = {
-            "id": str(node.id),
-            "type": node.node_type.name,
-            "name": getattr(node, "name", str(node.id)[:20]),
-            "group": _node_type_group(node.node_type)
+            "id": nid,
+            "type": node_type.name,
+            "name": node.name if node_type in _NAMED_TYPES else nid[:20],
+            "group": _node_type_group(node_type)
         }
-        
+
         # Add optional properties
-        if hasattr(node, 'familiarity_score'):
-            node_data["familiarity"] = node.familiarity_score
-        if hasattr(node, 'valence'):
+        if node_type is NodeType.AFFECT:
             node_data["valence"] = node.valence
-        
+        familiarity = getattr(node, 'familiarity_score', _MISSING)
+        if familiarity is not _MISSING:
+            node_data["familiarity"] = familiarity
+
         nodes.append(node_data)
-        node_ids.add(str(node.id))
+        node_ids.add(nid)
     
     # Collect all edges
     for edge in graph.edges():
@@ -54,94 +87,210 @@ def export_d3_json(graph: PlatialGraph) -> dict:
                 "value": edge.weight
             })
     
+    _compute_layout(nodes, links)
+
     return {"nodes": nodes, "links": links}
 
 
+def _compute_layout(nodes: list[dict], links: list[dict]) -> None:
+    """
+    Pin a server-side force layout onto the node dicts.
+
+    Runs a spring layout here and stores the result as normalized
+    `fx`/`fy` in [0, 1], so the browser renders a single static frame
+    instead of animating d3.forceSimulation from scratch — the usual
+    client-side bottleneck beyond a few hundred nodes.
+    """
+    if not nodes:
+        return
+
+    g = nx.Graph()
+    g.add_nodes_from(n["id"] for n in nodes)
+    g.add_edges_from((link["source"], link["target"]) for link in links)
+    pos = nx.spring_layout(g, seed=42)
+
+    xs = [p[0] for p in pos.values()]
+    ys = [p[1] for p in pos.values()]
+    x_min, x_span = min(xs), max(xs) - min(xs) or 1.0
+    y_min, y_span = min(ys), max(ys) - min(ys) or 1.0
+
+    for node in nodes:
+        x, y = pos[node["id"]]
+        node["fx"] = (x - x_min) / x_span
+        node["fy"] = (y - y_min) / y_span
+
+
 def export_force_graph(
-    graph: PlatialGraph, 
+    graph: PlatialGraph,
     output_path: str | Path,
-    title: str = "Chora Graph"
+    title: str = "Chora Graph",
+    renderer: str = "canvas"
 ) -> None:
     """
     Export graph as a standalone HTML file with D3.js force-directed visualization.
+
+    Parameters
+    ----------
+    renderer : str
+        "canvas" (default) draws all nodes and links onto a single
+        canvas with batched paths, which stays smooth well past the
+        point where per-element SVG DOM rendering starts to jank.
+        "svg" keeps the original one-element-per-node markup.
+    """
+    data_json = _d3_payload(graph)
+
+    if renderer == "canvas":
+        html = _canvas_html(data_json, title)
+    else:
+        html = _svg_html(data_json, title)
+
+    Path(output_path).write_bytes(html.encode())
+
+
+def _d3_payload(graph: PlatialGraph) -> str:
     """
+    Serialized D3 payload, memoized per graph version.
+
+    The graph's mutation counter is the change fingerprint; adapters
+    without one are serialized fresh each call.
+    """
+    version = getattr(graph, "version", None)
+    if version is None:
+        data = export_d3_json(graph)
+        return _EMPTY_D3_JSON if data is _EMPTY_D3 else _dumps(data)
+
+    key = (id(graph), version)
+    cached = _payload_cache.get(key)
+    if cached is not None:
+        _payload_cache.move_to_end(key)
+        return cached
+
     data = export_d3_json(graph)
-    data_json = json.dumps(data, indent=2, default=str)
-    
-    html = f"""<!DOCTYPE html>
+    payload = _EMPTY_D3_JSON if data is _EMPTY_D3 else _dumps(data)
+    _payload_cache[key] = payload
+    if len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+        _payload_cache.popitem(last=False)
+    return payload
+
+
+async def export_force_graph_async(
+    graph: PlatialGraph,
+    output_path: str | Path,
+    title: str = "Chora Graph",
+    renderer: str = "canvas"
+) -> None:
+    """
+    Async variant of :func:`export_force_graph`.
+
+    Runs the collection, serialization, and file write in a worker
+    thread so a serving event loop is not blocked by large graphs.
+    """
+    await asyncio.to_thread(
+        export_force_graph, graph, output_path, title, renderer
+    )
+
+
+def _svg_html(data_json: str, title: str) -> str:
+    """Render the force-graph page with per-element SVG markup."""
+    return (_SVG_TMPL
+            .replace("__TITLE__", html.escape(title))
+            .replace("__DATA__", data_json))
+
+
+def _canvas_html(data_json: str, title: str) -> str:
+    """Render the force-graph page onto a single canvas."""
+    return (_CANVAS_TMPL
+            .replace("__TITLE__", html.escape(title))
+            .replace("__DATA__", data_json))
+
+
+def _node_type_group(node_type: NodeType) -> int:
+    """Map node type to numeric group for D3 coloring."""
+    mapping = {
+        NodeType.AGENT: 1,
+        NodeType.SPATIAL_EXTENT: 2,
+        NodeType.ENCOUNTER: 3,
+        NodeType.FAMILIARITY: 4,
+        NodeType.AFFECT: 5,
+        NodeType.PRACTICE: 6,
+    }
+    return mapping.get(node_type, 0)
+
+
+_SVG_TMPL = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>{title}</title>
+    <title>__TITLE__</title>
     <script src="https://d3js.org/d3.v7.min.js"></script>
     <style>
-        body {{
+        body {
             font-family: system-ui, -apple-system, sans-serif;
             margin: 0;
             padding: 0;
             background: #1a1a2e;
             color: #eee;
-        }}
-        #container {{
+        }
+        #container {
             display: flex;
             height: 100vh;
-        }}
-        #graph {{
+        }
+        #graph {
             flex: 1;
-        }}
-        #sidebar {{
+        }
+        #sidebar {
             width: 280px;
             padding: 20px;
             background: #16213e;
             overflow-y: auto;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 1.2rem;
             margin: 0 0 1rem 0;
             color: #00d9ff;
-        }}
-        .legend {{
+        }
+        .legend {
             margin-bottom: 1rem;
-        }}
-        .legend-item {{
+        }
+        .legend-item {
             display: flex;
             align-items: center;
             margin: 4px 0;
             font-size: 0.85rem;
-        }}
-        .legend-color {{
+        }
+        .legend-color {
             width: 14px;
             height: 14px;
             border-radius: 50%;
             margin-right: 8px;
-        }}
-        .node {{
+        }
+        .node {
             cursor: pointer;
-        }}
-        .node text {{
+        }
+        .node text {
             font-size: 10px;
             fill: #fff;
-        }}
-        .link {{
+        }
+        .link {
             stroke-opacity: 0.6;
-        }}
-        #info {{
+        }
+        #info {
             background: #0f0f23;
             padding: 12px;
             border-radius: 6px;
             font-size: 0.85rem;
-        }}
-        #info h3 {{
+        }
+        #info h3 {
             margin: 0 0 8px 0;
             color: #00d9ff;
-        }}
+        }
     </style>
 </head>
 <body>
     <div id="container">
         <svg id="graph"></svg>
         <div id="sidebar">
-            <h1>🗺️ {title}</h1>
+            <h1>🗺️ __TITLE__</h1>
             <div class="legend">
                 <div class="legend-item"><span class="legend-color" style="background:#ff6b6b"></span>Agent</div>
                 <div class="legend-item"><span class="legend-color" style="background:#4ecdc4"></span>Spatial Extent</div>
@@ -157,28 +306,45 @@ def export_force_graph(
         </div>
     </div>
     <script>
-        const data = {data_json};
+        const data = __DATA__;
         
-        const colors = {{
+        const colors = {
             AGENT: "#ff6b6b",
             SPATIAL_EXTENT: "#4ecdc4",
             ENCOUNTER: "#ffe66d",
             FAMILIARITY: "#95e1d3",
             AFFECT: "#f38181",
             PRACTICE: "#aa96da"
-        }};
+        };
         
         const svg = d3.select("#graph");
         const width = svg.node().parentElement.offsetWidth - 280;
         const height = window.innerHeight;
         
         svg.attr("width", width).attr("height", height);
-        
+
+        // Positions were computed server-side (normalized to [0, 1]);
+        // scale them to the viewport and pin, so the simulation settles
+        // immediately instead of animating the layout from scratch
+        const pad = 40;
+        data.nodes.forEach(n => {
+            n.fx = pad + n.fx * (width - 2 * pad);
+            n.fy = pad + n.fy * (height - 2 * pad);
+            n.x = n.fx;
+            n.y = n.fy;
+        });
+
         const simulation = d3.forceSimulation(data.nodes)
             .force("link", d3.forceLink(data.links).id(d => d.id).distance(80))
             .force("charge", d3.forceManyBody().strength(-300))
-            .force("center", d3.forceCenter(width / 2, height / 2));
-        
+            .force("center", d3.forceCenter(width / 2, height / 2))
+            .alphaDecay(0.1)
+            .velocityDecay(0.4);
+
+        // Stop the simulation once it has been quiet for 2s so an idle
+        // tab is not burning CPU; drags restart it
+        let idle;
+
         const link = svg.append("g")
             .selectAll("line")
             .data(data.links)
@@ -196,15 +362,27 @@ def export_force_graph(
                 .on("start", dragstarted)
                 .on("drag", dragged)
                 .on("end", dragended))
-            .on("click", (event, d) => {{
-                document.getElementById("info").innerHTML = `
-                    <h3>${{d.name}}</h3>
-                    <p><strong>Type:</strong> ${{d.type}}</p>
-                    <p><strong>ID:</strong> ${{d.id}}</p>
-                    ${{d.familiarity !== undefined ? `<p><strong>Familiarity:</strong> ${{d.familiarity.toFixed(2)}}</p>` : ''}}
-                    ${{d.valence !== undefined ? `<p><strong>Valence:</strong> ${{d.valence.toFixed(2)}}</p>` : ''}}
-                `;
-            }});
+            .on("click", (event, d) => showInfo(d));
+
+        // Build the info panel with textContent: node names never hit
+        // the HTML parser, so hostile names cannot inject markup
+        function showInfo(d) {
+            const info = document.getElementById("info");
+            info.textContent = "";
+            const h3 = document.createElement("h3");
+            h3.textContent = d.name;
+            info.append(h3);
+            const rows = [["Type", d.type], ["ID", d.id]];
+            if (d.familiarity !== undefined) rows.push(["Familiarity", d.familiarity.toFixed(2)]);
+            if (d.valence !== undefined) rows.push(["Valence", d.valence.toFixed(2)]);
+            for (const [label, value] of rows) {
+                const p = document.createElement("p");
+                const strong = document.createElement("strong");
+                strong.textContent = label + ":";
+                p.append(strong, " " + value);
+                info.append(p);
+            }
+        }
         
         node.append("circle")
             .attr("r", d => d.type === "AGENT" ? 12 : 8)
@@ -215,47 +393,232 @@ def export_force_graph(
             .attr("dy", 4)
             .text(d => d.name);
         
-        simulation.on("tick", () => {{
+        simulation.on("tick", () => {
             link
                 .attr("x1", d => d.source.x)
                 .attr("y1", d => d.source.y)
                 .attr("x2", d => d.target.x)
                 .attr("y2", d => d.target.y);
             
-            node.attr("transform", d => `translate(${{d.x}},${{d.y}})`);
-        }});
-        
-        function dragstarted(event) {{
+            node.attr("transform", d => `translate(${d.x},${d.y})`);
+
+            clearTimeout(idle);
+            idle = setTimeout(() => simulation.stop(), 2000);
+        });
+
+        function dragstarted(event) {
             if (!event.active) simulation.alphaTarget(0.3).restart();
+            clearTimeout(idle);
             event.subject.fx = event.subject.x;
             event.subject.fy = event.subject.y;
-        }}
+        }
         
-        function dragged(event) {{
+        function dragged(event) {
             event.subject.fx = event.x;
             event.subject.fy = event.y;
-        }}
+        }
         
-        function dragended(event) {{
+        function dragended(event) {
             if (!event.active) simulation.alphaTarget(0);
             event.subject.fx = null;
             event.subject.fy = null;
-        }}
+        }
     </script>
 </body>
 </html>"""
-    
-    Path(output_path).write_text(html)
 
 
-def _node_type_group(node_type: NodeType) -> int:
-    """Map node type to numeric group for D3 coloring."""
-    mapping = {
-        NodeType.AGENT: 1,
-        NodeType.SPATIAL_EXTENT: 2,
-        NodeType.ENCOUNTER: 3,
-        NodeType.FAMILIARITY: 4,
-        NodeType.AFFECT: 5,
-        NodeType.PRACTICE: 6,
-    }
-    return mapping.get(node_type, 0)
+_CANVAS_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>__TITLE__</title>
+    <script src="https://d3js.org/d3.v7.min.js"></script>
+    <style>
+        body {
+            font-family: system-ui, -apple-system, sans-serif;
+            margin: 0;
+            padding: 0;
+            background: #1a1a2e;
+            color: #eee;
+        }
+        #container {
+            display: flex;
+            height: 100vh;
+        }
+        #graph {
+            flex: 1;
+            cursor: pointer;
+        }
+        #sidebar {
+            width: 280px;
+            padding: 20px;
+            background: #16213e;
+            overflow-y: auto;
+        }
+        h1 {
+            font-size: 1.2rem;
+            margin: 0 0 1rem 0;
+            color: #00d9ff;
+        }
+        .legend {
+            margin-bottom: 1rem;
+        }
+        .legend-item {
+            display: flex;
+            align-items: center;
+            margin: 4px 0;
+            font-size: 0.85rem;
+        }
+        .legend-color {
+            width: 14px;
+            height: 14px;
+            border-radius: 50%;
+            margin-right: 8px;
+        }
+        #info {
+            background: #0f0f23;
+            padding: 12px;
+            border-radius: 6px;
+            font-size: 0.85rem;
+        }
+        #info h3 {
+            margin: 0 0 8px 0;
+            color: #00d9ff;
+        }
+    </style>
+</head>
+<body>
+    <div id="container">
+        <canvas id="graph"></canvas>
+        <div id="sidebar">
+            <h1>🗺️ __TITLE__</h1>
+            <div class="legend">
+                <div class="legend-item"><span class="legend-color" style="background:#ff6b6b"></span>Agent</div>
+                <div class="legend-item"><span class="legend-color" style="background:#4ecdc4"></span>Spatial Extent</div>
+                <div class="legend-item"><span class="legend-color" style="background:#ffe66d"></span>Encounter</div>
+                <div class="legend-item"><span class="legend-color" style="background:#95e1d3"></span>Familiarity</div>
+                <div class="legend-item"><span class="legend-color" style="background:#f38181"></span>Affect</div>
+                <div class="legend-item"><span class="legend-color" style="background:#aa96da"></span>Practice</div>
+            </div>
+            <div id="info">
+                <h3>Selected Node</h3>
+                <p>Click a node to see details</p>
+            </div>
+        </div>
+    </div>
+    <script>
+        const data = __DATA__;
+
+        const colors = {
+            AGENT: "#ff6b6b",
+            SPATIAL_EXTENT: "#4ecdc4",
+            ENCOUNTER: "#ffe66d",
+            FAMILIARITY: "#95e1d3",
+            AFFECT: "#f38181",
+            PRACTICE: "#aa96da"
+        };
+
+        const canvas = document.getElementById("graph");
+        const ctx = canvas.getContext("2d");
+        const width = canvas.parentElement.offsetWidth - 280;
+        const height = window.innerHeight;
+        canvas.width = width;
+        canvas.height = height;
+
+        // Positions were computed server-side (normalized to [0, 1]);
+        // scale them to the viewport and pin, so the simulation settles
+        // immediately instead of animating the layout from scratch
+        const pad = 40;
+        data.nodes.forEach(n => {
+            n.fx = pad + n.fx * (width - 2 * pad);
+            n.fy = pad + n.fy * (height - 2 * pad);
+            n.x = n.fx;
+            n.y = n.fy;
+        });
+
+        const simulation = d3.forceSimulation(data.nodes)
+            .force("link", d3.forceLink(data.links).id(d => d.id).distance(80))
+            .force("charge", d3.forceManyBody().strength(-300))
+            .force("center", d3.forceCenter(width / 2, height / 2))
+            .alphaDecay(0.1)
+            .velocityDecay(0.4);
+
+        // Stop the simulation once it has been quiet for 2s so an idle
+        // tab is not burning CPU
+        let idle;
+
+        function draw() {
+            ctx.clearRect(0, 0, width, height);
+
+            // All links in one path: a single stroke() per frame
+            ctx.beginPath();
+            for (const l of data.links) {
+                ctx.moveTo(l.source.x, l.source.y);
+                ctx.lineTo(l.target.x, l.target.y);
+            }
+            ctx.strokeStyle = "#4a4a6a";
+            ctx.globalAlpha = 0.6;
+            ctx.stroke();
+            ctx.globalAlpha = 1;
+
+            // Nodes batched per fill colour: one fill() per colour
+            const byColor = new Map();
+            for (const n of data.nodes) {
+                const c = colors[n.type] || "#888";
+                let bucket = byColor.get(c);
+                if (!bucket) { bucket = []; byColor.set(c, bucket); }
+                bucket.push(n);
+            }
+            for (const [c, bucket] of byColor) {
+                ctx.beginPath();
+                for (const n of bucket) {
+                    const r = n.type === "AGENT" ? 12 : 8;
+                    ctx.moveTo(n.x + r, n.y);
+                    ctx.arc(n.x, n.y, r, 0, 2 * Math.PI);
+                }
+                ctx.fillStyle = c;
+                ctx.fill();
+            }
+
+            ctx.fillStyle = "#fff";
+            ctx.font = "10px system-ui, sans-serif";
+            for (const n of data.nodes) {
+                ctx.fillText(n.name, n.x + 12, n.y + 4);
+            }
+        }
+
+        simulation.on("tick", () => {
+            draw();
+            clearTimeout(idle);
+            idle = setTimeout(() => simulation.stop(), 2000);
+        });
+
+        canvas.addEventListener("mousedown", event => {
+            const [x, y] = d3.pointer(event);
+            const d = simulation.find(x, y, 15);
+            if (d) showInfo(d);
+        });
+
+        // Build the info panel with textContent: node names never hit
+        // the HTML parser, so hostile names cannot inject markup
+        function showInfo(d) {
+            const info = document.getElementById("info");
+            info.textContent = "";
+            const h3 = document.createElement("h3");
+            h3.textContent = d.name;
+            info.append(h3);
+            const rows = [["Type", d.type], ["ID", d.id]];
+            if (d.familiarity !== undefined) rows.push(["Familiarity", d.familiarity.toFixed(2)]);
+            if (d.valence !== undefined) rows.push(["Valence", d.valence.toFixed(2)]);
+            for (const [label, value] of rows) {
+                const p = document.createElement("p");
+                const strong = document.createElement("strong");
+                strong.textContent = label + ":";
+                p.append(strong, " " + value);
+                info.append(p);
+            }
+        }
+    </script>
+</body>
+</html>"""
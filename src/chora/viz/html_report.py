@@ -5,13 +5,19 @@ Generate comprehensive HTML reports summarizing a platial graph.
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
+from collections import Counter
+from html import escape as html_escape
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from chora.core import PlatialGraph
 from chora.core.types import NodeType, NodeId
+from chora.viz._json import dumps as _dumps
 
 
 def generate_report(
@@ -26,117 +32,233 @@ def generate_report(
     """
     # Collect statistics
     stats = _collect_stats(graph)
-    stats_json = json.dumps(stats, indent=2, default=str)
+    stats_json = _dumps(stats)
+    
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+    html = (_REPORT_TMPL
+            .replace("__TITLE__", html_escape(title))
+            .replace("__DATA__", stats_json)
+            .replace("__GENERATED__", generated))
+    
+    Path(output_path).write_bytes(html.encode())
+
+
+async def generate_report_async(
+    graph: PlatialGraph,
+    output_path: str | Path,
+    title: str = "Chora Report"
+) -> None:
+    """
+    Async variant of :func:`generate_report`.
+
+    Runs the stats collection, serialization, and file write in a
+    worker thread so a serving event loop is not blocked.
+    """
+    await asyncio.to_thread(generate_report, graph, output_path, title)
+
+
+# Stats for the empty graph, copied on return so callers can add keys
+_EMPTY_STATS = {
+    "node_count": 0,
+    "edge_count": 0,
+    "agent_count": 0,
+    "place_count": 0,
+    "node_types": {},
+    "agents": (),
+    "top_places": ()
+}
+
+
+def _collect_stats(graph: PlatialGraph) -> dict:
+    """Collect statistics from the graph."""
+    if graph.node_count == 0 and graph.edge_count == 0:
+        return _EMPTY_STATS.copy()
+
+    stats = {
+        "node_count": graph.node_count,
+        "edge_count": graph.edge_count,
+        "agent_count": 0,
+        "place_count": 0,
+        "node_types": {},
+        "agents": [],
+        "top_places": []
+    }
     
-    html = f"""<!DOCTYPE html>
+    # One scan over the node store: type histogram, the agent/place
+    # node lists, and the per-agent/per-extent encounter tallies all
+    # come out of the same pass instead of one filtered traversal per
+    # node type plus two more for the encounter joins
+    type_counts: Counter[str] = Counter()
+    agent_nodes = []
+    place_nodes = []
+    agent_ids: list[str] = []
+    extent_ids: list[str] = []
+
+    for node in graph.nodes():
+        node_type = node.node_type
+        type_counts[node_type.name] += 1
+        if node_type is NodeType.AGENT:
+            agent_nodes.append(node)
+        elif node_type is NodeType.SPATIAL_EXTENT:
+            place_nodes.append(node)
+        elif node_type is NodeType.ENCOUNTER:
+            agent_ids.append(str(node.agent_id))
+            extent_ids.append(str(node.extent_id))
+
+    # Histogram the id columns in C via np.unique rather than dict
+    # increments per encounter; for large E the Python-level tally
+    # dominates the report
+    enc_by_agent = _id_histogram(agent_ids)
+    visits_by_extent = _id_histogram(extent_ids)
+
+    stats["node_types"] = dict(type_counts)
+    stats["agent_count"] = type_counts["AGENT"]
+    stats["place_count"] = type_counts["SPATIAL_EXTENT"]
+
+    # Collect agents (typed list, so direct field access)
+    for node in agent_nodes:
+        node_id = str(node.id)
+        stats["agents"].append({
+            "name": node.name,
+            "id": node_id,
+            "encounter_count": enc_by_agent.get(node_id, 0)
+        })
+
+    # Collect top places
+    place_visits: dict[str, dict] = {}
+    for node in place_nodes:
+        node_id = str(node.id)
+        place_visits[node_id] = {
+            "name": node.name,
+            "visit_count": visits_by_extent.get(node_id, 0)
+        }
+
+    # Partial selection: only the top 10 are reported, so a full
+    # O(P log P) sort is wasted work
+    stats["top_places"] = heapq.nlargest(
+        10, place_visits.values(), key=lambda x: x["visit_count"]
+    )
+    
+    return stats
+
+
+def _id_histogram(ids: list[str]) -> dict[str, int]:
+    """Count occurrences of each id with a vectorized unique."""
+    if not ids:
+        return {}
+    uniq, counts = np.unique(np.asarray(ids), return_counts=True)
+    return dict(zip(uniq.tolist(), counts.tolist()))
+
+
+_REPORT_TMPL = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>{title}</title>
+    <title>__TITLE__</title>
     <style>
-        * {{ box-sizing: border-box; }}
-        body {{
+        * { box-sizing: border-box; }
+        body {
             font-family: system-ui, -apple-system, sans-serif;
             margin: 0;
             padding: 0;
             background: #f5f5f5;
             color: #333;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
             color: white;
             padding: 2rem;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2rem;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 0.5rem 0 0;
             opacity: 0.8;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 2rem;
-        }}
-        .grid {{
+        }
+        .grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 1.5rem;
             margin-bottom: 2rem;
-        }}
-        .card {{
+        }
+        .card {
             background: white;
             border-radius: 12px;
             padding: 1.5rem;
             box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        }}
-        .card h2 {{
+        }
+        .card h2 {
             margin: 0 0 1rem;
             font-size: 1.1rem;
             color: #1a1a2e;
             display: flex;
             align-items: center;
             gap: 0.5rem;
-        }}
-        .stat-grid {{
+        }
+        .stat-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 1rem;
-        }}
-        .stat {{
+        }
+        .stat {
             text-align: center;
             padding: 1rem;
             background: #f8f8f8;
             border-radius: 8px;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             font-size: 1.8rem;
             font-weight: bold;
             color: #00d9ff;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 0.8rem;
             color: #666;
             margin-top: 0.25rem;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 0.75rem;
             text-align: left;
             border-bottom: 1px solid #eee;
-        }}
-        th {{
+        }
+        th {
             background: #f8f8f8;
             font-weight: 600;
             font-size: 0.85rem;
             color: #666;
-        }}
-        .tag {{
+        }
+        .tag {
             display: inline-block;
             padding: 0.25rem 0.5rem;
             background: #e0f7fa;
             color: #0097a7;
             border-radius: 4px;
             font-size: 0.8rem;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             padding: 2rem;
             color: #888;
             font-size: 0.85rem;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
-        <h1>🗺️ {title}</h1>
-        <p>Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
+        <h1>🗺️ __TITLE__</h1>
+        <p>Generated __GENERATED__</p>
     </div>
     
     <div class="container">
@@ -200,90 +322,43 @@ def generate_report(
     </div>
     
     <script>
-        const stats = {stats_json};
+        const stats = __DATA__;
         
         document.getElementById('node-count').textContent = stats.node_count;
         document.getElementById('edge-count').textContent = stats.edge_count;
         document.getElementById('agent-count').textContent = stats.agent_count;
         document.getElementById('place-count').textContent = stats.place_count;
         
-        // Agents
-        const agentsBody = document.querySelector('#agents-table tbody');
-        stats.agents.forEach(a => {{
-            agentsBody.innerHTML += `<tr><td>${{a.name}}</td><td>${{a.encounter_count}}</td></tr>`;
-        }});
-        
-        // Places
-        const placesBody = document.querySelector('#places-table tbody');
-        stats.top_places.forEach(p => {{
-            placesBody.innerHTML += `<tr><td>${{p.name}}</td><td>${{p.visit_count}}</td></tr>`;
-        }});
-        
-        // Types
-        const typesBody = document.querySelector('#types-table tbody');
-        Object.entries(stats.node_types).forEach(([type, count]) => {{
-            typesBody.innerHTML += `<tr><td><span class="tag">${{type}}</span></td><td>${{count}}</td></tr>`;
-        }});
+        // Build rows with createElement/textContent and append one
+        // fragment per table: data values never hit the HTML parser
+        // (no injection from hostile names, no per-row reparse)
+        function fillTable(selector, rows) {
+            const frag = document.createDocumentFragment();
+            for (const cells of rows) {
+                const tr = document.createElement('tr');
+                for (const cell of cells) {
+                    const td = document.createElement('td');
+                    if (cell !== null && typeof cell === 'object') {
+                        const span = document.createElement('span');
+                        span.className = 'tag';
+                        span.textContent = cell.tag;
+                        td.append(span);
+                    } else {
+                        td.textContent = cell;
+                    }
+                    tr.append(td);
+                }
+                frag.append(tr);
+            }
+            document.querySelector(selector).append(frag);
+        }
+
+        fillTable('#agents-table tbody',
+            stats.agents.map(a => [a.name, a.encounter_count]));
+        fillTable('#places-table tbody',
+            stats.top_places.map(p => [p.name, p.visit_count]));
+        fillTable('#types-table tbody',
+            Object.entries(stats.node_types).map(([type, count]) => [{tag: type}, count]));
     </script>
 </body>
 </html>"""
-    
-    Path(output_path).write_text(html)
-
-
-def _collect_stats(graph: PlatialGraph) -> dict:
-    """Collect statistics from the graph."""
-    stats = {
-        "node_count": graph.node_count,
-        "edge_count": graph.edge_count,
-        "agent_count": 0,
-        "place_count": 0,
-        "node_types": {},
-        "agents": [],
-        "top_places": []
-    }
-    
-    # Count by type
-    for node_type in NodeType:
-        count = len(list(graph.nodes(node_type)))
-        if count > 0:
-            stats["node_types"][node_type.name] = count
-    
-    stats["agent_count"] = stats["node_types"].get("AGENT", 0)
-    stats["place_count"] = stats["node_types"].get("SPATIAL_EXTENT", 0)
-    
-    # Collect agents
-    for node in graph.nodes(NodeType.AGENT):
-        agent_data = {
-            "name": getattr(node, 'name', str(node.id)[:20]),
-            "id": str(node.id),
-            "encounter_count": 0
-        }
-        
-        # Count encounters for this agent
-        for enc in graph.nodes(NodeType.ENCOUNTER):
-            if hasattr(enc, 'agent_id') and str(enc.agent_id) == str(node.id):
-                agent_data["encounter_count"] += 1
-        
-        stats["agents"].append(agent_data)
-    
-    # Collect top places
-    place_visits: dict[str, dict] = {}
-    for node in graph.nodes(NodeType.SPATIAL_EXTENT):
-        place_visits[str(node.id)] = {
-            "name": getattr(node, 'name', str(node.id)[:20]),
-            "visit_count": 0
-        }
-    
-    for enc in graph.nodes(NodeType.ENCOUNTER):
-        extent_id = str(getattr(enc, 'extent_id', ''))
-        if extent_id in place_visits:
-            place_visits[extent_id]["visit_count"] += 1
-    
-    stats["top_places"] = sorted(
-        place_visits.values(), 
-        key=lambda x: x["visit_count"], 
-        reverse=True
-    )[:10]
-    
-    return stats
@@ -5,13 +5,15 @@ Generate timeline visualizations of encounters, familiarity, and affect over tim
 """
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime
+from html import escape as html_escape
 from pathlib import Path
 from typing import Any
 
 from chora.core import PlatialGraph
 from chora.core.types import NodeType, NodeId
+from chora.viz._json import dumps as _dumps
 
 
 def export_timeline_data(
@@ -24,25 +26,28 @@ def export_timeline_data(
     Returns a list of events sorted by time.
     """
     events = []
-    
+
+    # Resolve extent names once up front; a graph.get_node inside a
+    # try/except per encounter pays a node-store lookup (and often an
+    # exception) for every event
+    extent_names = {
+        str(n.id): n.name for n in graph.nodes(NodeType.SPATIAL_EXTENT)
+    }
+
+    # Encounters are enum-tagged dataclasses, so the hot loop uses
+    # direct field access rather than getattr-with-default per field
+    agent_str = str(agent_id)
     for node in graph.nodes(NodeType.ENCOUNTER):
-        if hasattr(node, 'agent_id') and str(node.agent_id) == str(agent_id):
-            event = {
-                "time": str(getattr(node, 'start_time', '')),
-                "timestamp": getattr(node, 'start_time', datetime.now()).isoformat() if hasattr(node, 'start_time') else None,
-                "extent_id": str(getattr(node, 'extent_id', '')),
-                "activity": getattr(node, 'activity', 'unknown'),
-                "id": str(node.id)
-            }
-            
-            # Try to get extent name
-            try:
-                extent = graph.get_node(node.extent_id)
-                event["extent_name"] = getattr(extent, 'name', str(node.extent_id)[:20])
-            except Exception:
-                event["extent_name"] = str(getattr(node, 'extent_id', ''))[:20]
-            
-            events.append(event)
+        if str(node.agent_id) == agent_str:
+            extent_id = str(node.extent_id)
+            events.append({
+                "time": str(node.start_time),
+                "timestamp": node.start_time.isoformat(),
+                "extent_id": extent_id,
+                "activity": node.activity,
+                "id": str(node.id),
+                "extent_name": extent_names.get(extent_id, extent_id[:20])
+            })
     
     # Sort by timestamp
     events.sort(key=lambda e: e.get('timestamp') or '')
@@ -60,33 +65,57 @@ def export_timeline_html(
     Generate an interactive HTML timeline visualization.
     """
     events = export_timeline_data(graph, agent_id)
-    events_json = json.dumps(events, indent=2, default=str)
+    events_json = _dumps(events)
+    
+    html = (_TIMELINE_TMPL
+            .replace("__TITLE__", html_escape(title))
+            .replace("__DATA__", events_json))
     
-    html = f"""<!DOCTYPE html>
+    Path(output_path).write_bytes(html.encode())
+
+
+async def export_timeline_html_async(
+    graph: PlatialGraph,
+    agent_id: NodeId,
+    output_path: str | Path,
+    title: str = "Encounter Timeline"
+) -> None:
+    """
+    Async variant of :func:`export_timeline_html`.
+
+    Runs the event collection, serialization, and file write in a
+    worker thread so a serving event loop is not blocked.
+    """
+    await asyncio.to_thread(
+        export_timeline_html, graph, agent_id, output_path, title
+    )
+
+
+_TIMELINE_TMPL = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>{title}</title>
+    <title>__TITLE__</title>
     <style>
-        * {{ box-sizing: border-box; }}
-        body {{
+        * { box-sizing: border-box; }
+        body {
             font-family: system-ui, -apple-system, sans-serif;
             margin: 0;
             padding: 2rem;
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
             color: #eee;
             min-height: 100vh;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #00d9ff;
             margin-bottom: 2rem;
-        }}
-        .timeline {{
+        }
+        .timeline {
             position: relative;
             max-width: 800px;
             margin: 0 auto;
-        }}
-        .timeline::before {{
+        }
+        .timeline::before {
             content: '';
             position: absolute;
             left: 50%;
@@ -95,8 +124,8 @@ def export_timeline_html(
             height: 100%;
             background: linear-gradient(to bottom, #00d9ff, #aa96da);
             border-radius: 2px;
-        }}
-        .event {{
+        }
+        .event {
             position: relative;
             width: 45%;
             padding: 1rem 1.5rem;
@@ -105,14 +134,14 @@ def export_timeline_html(
             margin-bottom: 1.5rem;
             backdrop-filter: blur(10px);
             border: 1px solid rgba(255,255,255,0.1);
-        }}
-        .event:nth-child(odd) {{
+        }
+        .event:nth-child(odd) {
             left: 0;
-        }}
-        .event:nth-child(even) {{
+        }
+        .event:nth-child(even) {
             left: 55%;
-        }}
-        .event::before {{
+        }
+        .event::before {
             content: '';
             position: absolute;
             width: 16px;
@@ -120,68 +149,68 @@ def export_timeline_html(
             background: #00d9ff;
             border-radius: 50%;
             top: 1.5rem;
-        }}
-        .event:nth-child(odd)::before {{
+        }
+        .event:nth-child(odd)::before {
             right: -8%;
             transform: translateX(50%);
-        }}
-        .event:nth-child(even)::before {{
+        }
+        .event:nth-child(even)::before {
             left: -8%;
             transform: translateX(-50%);
-        }}
-        .event-time {{
+        }
+        .event-time {
             font-size: 0.8rem;
             color: #00d9ff;
             margin-bottom: 0.5rem;
-        }}
-        .event-place {{
+        }
+        .event-place {
             font-size: 1.1rem;
             font-weight: 600;
             margin-bottom: 0.25rem;
-        }}
-        .event-activity {{
+        }
+        .event-activity {
             font-size: 0.9rem;
             color: #aaa;
-        }}
-        .stats {{
+        }
+        .stats {
             display: flex;
             gap: 2rem;
             margin-bottom: 2rem;
             justify-content: center;
-        }}
-        .stat {{
+        }
+        .stat {
             text-align: center;
             background: rgba(255,255,255,0.05);
             padding: 1rem 2rem;
             border-radius: 8px;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             font-size: 2rem;
             color: #00d9ff;
             font-weight: bold;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 0.9rem;
             color: #888;
-        }}
-        @media (max-width: 600px) {{
-            .event {{
+        }
+        @media (max-width: 600px) {
+            .event {
                 width: 100%;
                 left: 0 !important;
-            }}
-            .timeline::before {{
+            }
+            .timeline::before {
                 left: 1rem;
-            }}
-            .event::before {{
+            }
+            .event::before {
                 left: -1.5rem !important;
                 right: auto !important;
                 transform: none !important;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
-    <h1>📍 {title}</h1>
+    <h1>📍 __TITLE__</h1>
     
     <div class="stats">
         <div class="stat">
@@ -201,7 +230,7 @@ def export_timeline_html(
     <div class="timeline" id="timeline"></div>
     
     <script>
-        const events = {events_json};
+        const events = __DATA__;
         const container = document.getElementById('timeline');
         
         // Stats
@@ -209,26 +238,34 @@ def export_timeline_html(
         const uniquePlaces = new Set(events.map(e => e.extent_name));
         document.getElementById('unique-places').textContent = uniquePlaces.size;
         
-        if (events.length > 0) {{
+        if (events.length > 0) {
             const first = events[0].timestamp?.split('T')[0] || '-';
             const last = events[events.length-1].timestamp?.split('T')[0] || '-';
             document.getElementById('date-range').textContent = 
-                first === last ? first : `${{first.slice(5)}} - ${{last.slice(5)}}`;
-        }}
+                first === last ? first : `${first.slice(5)} - ${last.slice(5)}`;
+        }
         
-        // Render events
-        events.forEach((e, i) => {{
-            const time = e.timestamp ? new Date(e.timestamp).toLocaleString() : e.time;
-            container.innerHTML += `
-                <div class="event">
-                    <div class="event-time">${{time}}</div>
-                    <div class="event-place">${{e.extent_name}}</div>
-                    <div class="event-activity">${{e.activity}}</div>
-                </div>
-            `;
-        }});
+        // Build events with createElement/textContent and append one
+        // fragment: place and activity strings never hit the HTML
+        // parser (no injection from hostile values, no reparsing)
+        const frag = document.createDocumentFragment();
+        for (const e of events) {
+            const event = document.createElement('div');
+            event.className = 'event';
+            const parts = [
+                ['event-time', e.timestamp ? new Date(e.timestamp).toLocaleString() : e.time],
+                ['event-place', e.extent_name],
+                ['event-activity', e.activity],
+            ];
+            for (const [cls, text] of parts) {
+                const div = document.createElement('div');
+                div.className = cls;
+                div.textContent = text;
+                event.append(div);
+            }
+            frag.append(event);
+        }
+        container.append(frag);
     </script>
 </body>
 </html>"""
-    
-    Path(output_path).write_text(html)
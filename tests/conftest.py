@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from datetime import datetime, timedelta
 from chora.core import (
@@ -5,29 +7,41 @@ from chora.core import (
     PlatialEdge, EdgeType
 )
 
+# Canonical fixture objects are built once per session; each test gets
+# a deep copy, so per-test setup is a memcpy instead of reconstruction
+# (the extent's geometry build is the expensive part).
+
+@pytest.fixture(scope="session")
+def _agent_alice_template():
+    return Agent.individual("Alice", age=30)
+
+@pytest.fixture(scope="session")
+def _park_extent_template():
+    return SpatialExtent.from_bounds(
+        -0.127, 51.507, -0.126, 51.508,
+        name="Test Park"
+    )
+
 @pytest.fixture
 def basic_graph():
     """Return a fresh empty graph."""
     return PlatialGraph(name="Test Graph")
 
 @pytest.fixture
-def agent_alice():
+def agent_alice(_agent_alice_template):
     """Return a standard test agent."""
-    return Agent.individual("Alice", age=30)
+    return copy.deepcopy(_agent_alice_template)
 
 @pytest.fixture
-def park_extent():
+def park_extent(_park_extent_template):
     """Return a standard test spatial extent."""
-    return SpatialExtent.from_bounds(
-        -0.127, 51.507, -0.126, 51.508, 
-        name="Test Park"
-    )
+    return copy.deepcopy(_park_extent_template)
 
 @pytest.fixture
 def encounter_factory(agent_alice, park_extent):
     """
     Return a function that creates encounters easily.
-    
+
     Usage:
         enc = encounter_factory(start_time=dt)
     """
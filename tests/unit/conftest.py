@@ -0,0 +1,72 @@
+"""
+Unit-test fixtures.
+
+Graph fixtures shared with other suites live in tests/conftest.py;
+this file holds unit-only helpers, chiefly the mocked embedding model.
+"""
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from chora.core import PlatialEdge
+
+
+@pytest.fixture(scope="session")
+def mocked_embedder():
+    """
+    Construct a LocalEmbedder once against a mocked sentence_transformers.
+
+    The patch is only active while the embedder binds its model, so the
+    mock never leaks into sys.modules for other tests. Yields the
+    embedder and the mock model; tests call reset_mock() between uses.
+    """
+    mock_st = MagicMock()
+    mock_model = mock_st.SentenceTransformer.return_value
+    mock_model.encode.return_value = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+
+    with patch.dict(sys.modules, {'sentence_transformers': mock_st}):
+        from chora.embeddings.local import LocalEmbedder
+        embedder = LocalEmbedder()
+    yield embedder, mock_model
+
+
+@pytest.fixture(scope="session")
+def shared_rng():
+    """One seeded generator for every sampling test in the session."""
+    return np.random.default_rng(seed=42)
+
+
+@pytest.fixture
+def linked_encounter(basic_graph, agent_alice, park_extent, encounter_factory):
+    """
+    Return a factory that builds an encounter fully wired into the graph.
+
+    Adds the agent and extent on first use, then creates the encounter
+    and its participates_in/occurs_at edges in one call — replacing the
+    six-line setup block repeated across the derive tests.
+    """
+    def _make(**kwargs):
+        if not basic_graph.has_node(agent_alice.id):
+            basic_graph.add_node(agent_alice)
+            basic_graph.add_node(park_extent)
+        enc = encounter_factory(**kwargs)
+        basic_graph.add_node(enc)
+        basic_graph.add_edge(PlatialEdge.participates_in(agent_alice.id, enc.id))
+        basic_graph.add_edge(PlatialEdge.occurs_at(enc.id, park_extent.id))
+        return enc
+    return _make
+
+
+@pytest.fixture(scope="session")
+def real_embedder():
+    """
+    One warmed production LocalEmbedder for the whole session.
+
+    Loading the sentence-transformers weights dominates any test using
+    the real model; share a single instance rather than reloading.
+    """
+    pytest.importorskip("sentence_transformers")
+    from chora.embeddings.local import LocalEmbedder
+    return LocalEmbedder()
@@ -1,6 +1,8 @@
 """
 Unit tests for Adapters.
 """
+import sys
+
 import pytest
 from unittest.mock import MagicMock, patch
 from chora.core import PlatialNode, Agent, PlatialGraph, PlatialEdge
@@ -53,9 +55,6 @@ def test_in_memory_save_load(basic_graph, agent_alice, park_extent, encounter_fa
 # Neo4j Adapter Tests (Mocked)
 # -----------------------------------------------------------------------------
 
-import sys
-from unittest.mock import MagicMock, patch
-
 def test_neo4j_missing_dependency():
     """Test that AdapterError is raised if neo4j is missing."""
     # Ensure neo4j is NOT in sys.modules
@@ -74,27 +73,39 @@ def test_neo4j_missing_dependency():
         with pytest.raises(Exception, match="neo4j package not installed"):
              Neo4jAdapter("bolt://localhost")
 
-def test_neo4j_save_graph():
-    """Test save_graph calls driver correctly (with mocked neo4j)."""
-    # Mock the neo4j module
+@pytest.fixture(scope="module")
+def neo4j_mocked():
+    """
+    Patch in a mocked neo4j module once for this file.
+
+    Building the MagicMock tree and resolving the adapter import are
+    paid a single time; tests receive the adapter class and the mock
+    session and just reset_mock() between uses.
+    """
     mock_neo4j = MagicMock()
     mock_driver = MagicMock()
     mock_session = MagicMock()
     mock_driver.session.return_value.__enter__.return_value = mock_session
     mock_neo4j.GraphDatabase.driver.return_value = mock_driver
-    
+
     with patch.dict(sys.modules, {'neo4j': mock_neo4j}):
-        # Now we can instantiate without error
         from chora.adapters.neo4j import Neo4jAdapter
-        adapter = Neo4jAdapter("bolt://localhost")
-        adapter.connect() # uses the mocked driver
-        
-        # Create a small graph
-        g = PlatialGraph("Mock Graph")
-        a = Agent.individual("Mock Agent")
-        g.add_node(a)
-        
-        adapter.save_graph(g)
-        
-        # Verify session executed write
-        assert mock_session.execute_write.called
+        yield Neo4jAdapter, mock_session
+
+def test_neo4j_save_graph(neo4j_mocked):
+    """Test save_graph calls driver correctly (with mocked neo4j)."""
+    Neo4jAdapter, mock_session = neo4j_mocked
+    mock_session.reset_mock()
+
+    adapter = Neo4jAdapter("bolt://localhost")
+    adapter.connect() # uses the mocked driver
+
+    # Create a small graph
+    g = PlatialGraph("Mock Graph")
+    a = Agent.individual("Mock Agent")
+    g.add_node(a)
+
+    adapter.save_graph(g)
+
+    # Verify session executed write
+    assert mock_session.execute_write.called
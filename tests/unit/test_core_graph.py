@@ -34,8 +34,7 @@ def test_add_edge(basic_graph, agent_alice, park_extent, encounter_factory):
     assert basic_graph.edge_count == 1
     
     # Verify connectivity
-    outgoing = list(basic_graph.outgoing_edges(agent_alice.id))
-    assert any(e.id == edge_id for e in outgoing)
+    assert basic_graph.has_outgoing_edge(agent_alice.id, edge_id)
 
 def test_add_edge_missing_node(basic_graph, agent_alice, encounter_factory):
     """Test adding edge with missing nodes raises error."""
@@ -10,6 +10,11 @@ from chora.core.temporal import (
     InvalidTimeIntervalError
 )
 
+# Interval math needs a consistent reference, not wall-clock time; a
+# frozen constant keeps the tests deterministic and skips the
+# per-call clock syscall
+FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
 def test_exponential_decay_calculations():
     """Verify exponential decay math."""
     initial_value = 1.0
@@ -21,12 +26,11 @@ def test_exponential_decay_calculations():
     
     # At t=half_life, value should be 0.5
     val_half = exponential_decay(initial_value, half_life, half_life)
-    # Floating point comparison
-    assert abs(val_half - 0.5) < 1e-9
-    
+    assert val_half == pytest.approx(0.5, abs=1e-9)
+
     # At t=2*half_life, value should be 0.25
     val_quarter = exponential_decay(initial_value, half_life * 2, half_life)
-    assert abs(val_quarter - 0.25) < 1e-9
+    assert val_quarter == pytest.approx(0.25, abs=1e-9)
 
 def test_linear_decay_calculations():
     """Verify linear decay math."""
@@ -48,7 +52,7 @@ def test_linear_decay_calculations():
 
 def test_time_interval_validation():
     """Verify time range validation in TimeInterval."""
-    now = datetime.now()
+    now = FIXED_NOW
     later = now + timedelta(hours=1)
     
     # Valid range
@@ -5,6 +5,8 @@ import pytest
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from chora.core.types import (
     NodeType, EdgeType, EpistemicLevel, ContextType,
     AffectDimension, PracticeType, LiminalityType, MeaningType
@@ -153,32 +155,24 @@ class TestTemporalValidity:
 
 class TestDecayFunctions:
     """Tests for decay functions."""
-    
-    def test_exponential_decay_half_life(self):
-        """Test exponential decay at half-life."""
-        result = exponential_decay(1.0, 7.0, half_life=7.0)
-        assert abs(result - 0.5) < 0.001
-    
-    def test_exponential_decay_two_half_lives(self):
-        """Test exponential decay at two half-lives."""
-        result = exponential_decay(1.0, 14.0, half_life=7.0)
-        assert abs(result - 0.25) < 0.001
-    
-    def test_exponential_decay_zero_time(self):
-        """Test no decay at time zero."""
-        result = exponential_decay(0.8, 0.0)
+
+    def test_exponential_decay_vectorized(self):
+        """Test exponential decay at characteristic times in one call."""
+        result = exponential_decay(
+            1.0, np.array([0.0, 7.0, 14.0]), half_life=7.0
+        )
+        assert result == pytest.approx([1.0, 0.5, 0.25], abs=1e-9)
+
+    def test_exponential_decay_scalar(self):
+        """Test the scalar path still returns a plain float."""
+        result = exponential_decay(0.8, 0.0, half_life=7.0)
         assert result == 0.8
-    
-    def test_linear_decay(self):
-        """Test linear decay."""
-        result = linear_decay(1.0, 5.0, rate=0.1)
-        assert abs(result - 0.5) < 0.001
-    
-    def test_linear_decay_clamp(self):
-        """Test linear decay clamps to 0."""
-        result = linear_decay(1.0, 20.0, rate=0.1)
-        assert result == 0.0
-    
+
+    def test_linear_decay_vectorized(self):
+        """Test linear decay, including the clamp to zero, in one call."""
+        result = linear_decay(1.0, np.array([0.0, 5.0, 20.0]), rate=0.1)
+        assert result == pytest.approx([1.0, 0.5, 0.0], abs=1e-9)
+
     def test_power_law_decay(self):
         """Test power law decay."""
         result = power_law_decay(1.0, 3.0, exponent=0.5, offset=1.0)
@@ -219,17 +213,14 @@ class TestConfidenceInterval:
         assert ci.contains(0.5)
         assert not ci.contains(0.1)
     
-    def test_width_property(self):
-        """Test width as property."""
-        ci = ConfidenceInterval(lower=0.4, upper=0.6)
-        # width is a property
-        assert abs(ci.width - 0.2) < 0.001
-    
-    def test_midpoint_property(self):
-        """Test midpoint as property."""
+    @pytest.mark.parametrize("prop,expected", [
+        ("width", 0.2),
+        ("midpoint", 0.5),
+    ])
+    def test_derived_properties(self, prop, expected):
+        """Test width and midpoint as properties."""
         ci = ConfidenceInterval(lower=0.4, upper=0.6)
-        # midpoint is a property
-        assert abs(ci.midpoint - 0.5) < 0.001
+        assert getattr(ci, prop) == pytest.approx(expected, abs=0.001)
     
     def test_invalid_bounds(self):
         """Test that invalid bounds raise error."""
@@ -277,10 +268,10 @@ class TestGaussianDistribution:
         pdf_away = dist.pdf(1.0)
         assert pdf_at_mean > pdf_away
     
-    def test_sample(self):
+    def test_sample(self, shared_rng):
         """Test sampling produces finite values."""
         dist = GaussianDistribution(mu=0.0, sigma=1.0)
-        sample = dist.sample()
+        sample = dist.sample(rng=shared_rng)
         assert math.isfinite(sample)
     
     def test_confidence_interval(self):
@@ -311,13 +302,13 @@ class TestCategoricalDistribution:
         mode = dist.mode if hasattr(dist, 'mode') and not callable(dist.mode) else dist.mode()
         assert mode == "a"
     
-    def test_sample(self):
+    def test_sample(self, shared_rng):
         """Test sampling returns valid category."""
         dist = CategoricalDistribution(
             categories=["a", "b", "c"],
             probabilities=[0.5, 0.3, 0.2]
         )
-        sample = dist.sample()
+        sample = dist.sample(rng=shared_rng)
         assert sample in ["a", "b", "c"]
     
     def test_entropy_positive(self):
@@ -340,19 +331,8 @@ class TestFuzzyMembership:
         assert tf.left == 0.0
         assert tf.peak == 0.5
     
-    def test_triangular_membership_at_peak(self):
-        """Test triangular membership at peak."""
-        tf = TriangularFuzzy(left=0.0, peak=0.5, right=1.0)
-        assert tf.membership(0.5) == 1.0
-    
-    def test_triangular_membership_at_boundaries(self):
-        """Test triangular membership at boundaries."""
-        tf = TriangularFuzzy(left=0.0, peak=0.5, right=1.0)
-        assert tf.membership(0.0) == 0.0
-        assert tf.membership(1.0) == 0.0
-    
-    def test_triangular_membership_in_between(self):
-        """Test triangular membership in between."""
+    def test_triangular_membership(self):
+        """Test triangular membership at peak, boundaries, and midpoint."""
         tf = TriangularFuzzy(left=0.0, peak=0.5, right=1.0)
-        result = tf.membership(0.25)
-        assert 0.0 < result < 1.0
+        assert [tf.membership(x) for x in (0.5, 0.0, 1.0, 0.25)] == \
+            pytest.approx([1.0, 0.0, 0.0, 0.5], abs=1e-9)
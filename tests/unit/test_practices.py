@@ -1,13 +1,14 @@
 """
 Tests for practice and routine detection.
 """
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 
 from chora.core import PlatialGraph, Agent, SpatialExtent, Encounter, PlatialEdge
 from chora.derive.practices import (
-    detect_practices, detect_routines, find_sequence_patterns,
-    PracticeDetectionConfig
+    circular_regularity, detect_practices, detect_routines,
+    find_sequence_patterns, PracticeDetectionConfig
 )
 from chora.core.types import PracticeType
 
@@ -25,20 +26,23 @@ class TestPracticeDetection:
         agent_id = "agent_test"
         extent_id = "park_test"
         
-        encounters = []
-        base_time = datetime(2025, 1, 1, 9, 0)  # 9am
-        
-        # Create routine: park visit at 9am for 10 days
-        for i in range(10):
-            enc = Encounter(
+        # Routine: park visit at 9am for 10 days. One vectorized
+        # datetime64 broadcast replaces per-day timedelta arithmetic.
+        starts = (
+            np.datetime64("2025-01-01T09:00") + np.arange(10) * np.timedelta64(1, "D")
+        ).astype("datetime64[us]").astype(datetime)
+
+        encounters = [
+            Encounter(
                 agent_id=agent_id,
                 extent_id=extent_id,
-                start_time=base_time + timedelta(days=i),
-                end_time=base_time + timedelta(days=i, hours=1),
+                start_time=start,
+                end_time=start + timedelta(hours=1),
                 activity="morning walk"
             )
-            encounters.append(enc)
-        
+            for start in starts
+        ]
+
         return encounters, agent_id
     
     @pytest.fixture
@@ -48,27 +52,33 @@ class TestPracticeDetection:
         home_id = "home"
         office_id = "office"
         
-        encounters = []
-        base_time = datetime(2025, 1, 1, 8, 0)
-        
-        # Create sequence: home → office for 10 days
-        for i in range(10):
-            # Morning at home
-            enc_home = Encounter(
-                agent_id=agent_id,
-                extent_id=home_id,
-                start_time=base_time + timedelta(days=i),
-                end_time=base_time + timedelta(days=i, hours=1)
-            )
-            # Arrive at office
-            enc_office = Encounter(
-                agent_id=agent_id,
-                extent_id=office_id,
-                start_time=base_time + timedelta(days=i, hours=2),
-                end_time=base_time + timedelta(days=i, hours=10)
+        # Sequence: home at 8am, office at 10am, for 10 days; day
+        # starts come from one datetime64 broadcast
+        days = (
+            np.datetime64("2025-01-01T08:00") + np.arange(10) * np.timedelta64(1, "D")
+        ).astype("datetime64[us]").astype(datetime)
+
+        # Morning at home, then the office — one flat comprehension
+        # instead of growing the list with per-day appends
+        encounters = [
+            enc
+            for day in days
+            for enc in (
+                Encounter(
+                    agent_id=agent_id,
+                    extent_id=home_id,
+                    start_time=day,
+                    end_time=day + timedelta(hours=1)
+                ),
+                Encounter(
+                    agent_id=agent_id,
+                    extent_id=office_id,
+                    start_time=day + timedelta(hours=2),
+                    end_time=day + timedelta(hours=10)
+                ),
             )
-            encounters.extend([enc_home, enc_office])
-        
+        ]
+
         return encounters, agent_id
     
     def test_detect_routines_from_regular_visits(self, routine_encounters):
@@ -149,10 +159,14 @@ class TestPracticeDetection:
         
         config = PracticeDetectionConfig(min_regularity=0.8)
         routines = detect_routines(encounters, config)
-        
+
         # Should not detect a routine due to low regularity
         assert len(routines) == 0
 
+        # The same hours score low through the kernel directly
+        hours = np.array([9, 14, 22, 6, 18, 3, 15, 20], dtype=np.float64)
+        assert circular_regularity(hours) < 0.5
+
 
 # =============================================================================
 # Practice Detection Config Tests